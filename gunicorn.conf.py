@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for the Flask web UI
+
+Run with: gunicorn -c gunicorn.conf.py web.app:app
+"""
+
+import os
+
+# Bind to the same host/port settings as web/app.py
+bind = f"{os.getenv('WEB_HOST', '0.0.0.0')}:{os.getenv('WEB_PORT', os.getenv('PORT', 8080))}"
+
+# A couple of processes, each serving requests on a small thread pool.
+# SQLite calls block in C, so threads overlap them where gevent greenlets
+# can't; DatabaseManager already keeps one connection per thread. Every
+# worker holds its own connections and cache against the one SQLite file,
+# and the host's CPU count says nothing about the container's CPU quota,
+# so the default is a small fixed number.
+workers = int(os.getenv('WEB_WORKERS', 2))
+worker_class = 'gthread'
+threads = int(os.getenv('WEB_THREADS', 4))
+
+timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'info').lower()
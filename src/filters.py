@@ -1,12 +1,14 @@
 import re
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 import logging
 from decimal import Decimal
+from functools import lru_cache
 
 # Try to import salary_extractor, but provide fallback if it fails
 try:
-    from .salary_extractor import salary_extractor, extract_salary_from_text
+    from .salary_extractor import salary_extractor, extract_salary_from_text, _has_currency, _re2_unicode
 except ImportError:
     # Fallback for when running outside of package context
     class MockSalaryExtractor:
@@ -18,6 +20,17 @@ except ImportError:
     
     salary_extractor = MockSalaryExtractor()
     extract_salary_from_text = lambda x: []
+    _has_currency = lambda x: False
+    # Without the Unicode class rewrite RE2 would match differently, so
+    # every pattern stays on re
+    _re2_unicode = None
+
+# Use Google RE2 for regular patterns when available; it matches in linear
+# time without backtracking
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 # Try to import logging_config, but provide fallback if it fails
 try:
@@ -29,6 +42,49 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+def _compile_pattern(pattern: str):
+    """Compile a case-insensitive pattern, with RE2 if installed"""
+    if re2 is not None and _re2_unicode is not None:
+        try:
+            # \s and \d are spelled out so RE2 matches Unicode like re does
+            return re2.compile('(?i)' + _re2_unicode(pattern))
+        except re2.error:
+            logger.debug(f'Pattern not supported by RE2, using re: {pattern}')
+    return re.compile(pattern, re.IGNORECASE)
+
+# Job-seeking phrases that mark a resume keyword as being in resume context
+_SEEKING_PATTERNS = [
+    _compile_pattern(pattern) for pattern in (
+        r'ищу\s+работу', r'looking\s+for\s+job', r'seeking\s+position',
+        r'открыт\s+к\s+предложениям', r'open\s+to\s+opportunities'
+    )
+]
+
+# How long a computed date-filter cutoff is reused before re-reading the clock;
+# the windows are hour-sized, so a few seconds of drift doesn't matter
+_CUTOFF_REFRESH_SECONDS = 30
+
+# Lexicon category bits reported by RussianJobFilter._lexicon_mask
+_SENIOR = 1
+_REMOTE = 2
+_JUNIOR = 4
+
+def _mentions_salary(text: str) -> bool:
+    """Cheap check for whether text could contain a salary at all"""
+    # Same currency check the salary extractor gates on, plus the word "salary"
+    return _has_currency(text) or 'salary' in text.lower()
+
+def _compile_keyword_pattern(keywords: List[str], whole_word: bool = True) -> Optional[re.Pattern]:
+    """Compile keywords into one case-insensitive alternation scanned in a single pass"""
+    if not keywords:
+        return None
+    # Longest first so e.g. 'react native' wins over 'react' at the same position
+    alternation = '|'.join(re.escape(keyword) for keyword in sorted(set(keywords), key=len, reverse=True))
+    if whole_word:
+        # Lookarounds aren't supported by RE2, so whole-word patterns stay on re
+        return re.compile(rf'(?<!\w)(?:{alternation})(?!\w)', re.IGNORECASE)
+    return _compile_pattern(alternation)
+
 class RussianJobFilter:
     """Advanced filter for Russian job postings with specific requirements"""
     
@@ -133,9 +189,40 @@ class RussianJobFilter:
             r'(\d+)\s*years?\s*experience',  # 2 years experience
         ]
         
+        # Each lexicon is scanned as one alternation instead of a loop of
+        # substring checks; substring semantics are kept on purpose
+        self._keyword_re = _compile_keyword_pattern(self.keywords, whole_word=False)
+        self._exclude_re = _compile_keyword_pattern(self.exclude_keywords, whole_word=False)
+        self._non_developer_re = _compile_keyword_pattern(self.non_developer_keywords, whole_word=False)
+        self._junior_re = _compile_keyword_pattern(self.junior_keywords, whole_word=False)
+        self._remote_re = _compile_keyword_pattern(self.remote_keywords, whole_word=False)
+        self._lexicon_res = (
+            (_SENIOR, self._exclude_re),
+            (_REMOTE, self._remote_re),
+            (_JUNIOR, self._junior_re),
+        )
+        
+        # All experience patterns in one alternation; each keeps its single years group
+        self._experience_re = _compile_pattern(
+            '|'.join(f'(?:{pattern})' for pattern in self.experience_patterns)
+        )
+        
+        # get_matched_keywords is often asked about the same reposted text
+        self._keyword_matches = lru_cache(maxsize=1024)(self._find_keyword_matches)
+        
+        # Cached date-filter cutoff and the monotonic time it was computed
+        self._cutoff = None
+        self._cutoff_at = 0.0
+        
     def filter_message(self, message: Dict[str, Any]) -> bool:
         """Apply all filters to a message"""
         try:
+            # Check date filter first; stale messages skip all text scanning
+            message_date = self._extract_message_date(message)
+            if not self.matches_date_filter(message_date):
+                logger.debug('Message excluded: outside date filter window')
+                return False
+            
             # Extract message text
             text = self._extract_message_text(message)
             if not text:
@@ -147,37 +234,38 @@ class RussianJobFilter:
                 logger.debug('Message excluded: no keyword matches')
                 return False
             
-            # Check date filter
-            message_date = self._extract_message_date(message)
-            if not self.matches_date_filter(message_date):
-                logger.debug('Message excluded: outside date filter window')
-                return False
+            # Cheap lexicon checks first, so most rejections skip the
+            # resume-context and experience scans below
+            mask = self._lexicon_mask(text)
             
             # Check exclude keywords (senior/middle positions)
-            if self.has_exclude_keywords(text):
+            if mask & _SENIOR:
                 logger.debug(f'Message excluded: contains senior/middle keywords')
                 return False
             
+            # Check remote work requirement
+            if not mask & _REMOTE:
+                logger.debug(f'Message excluded: no remote work mentioned')
+                return False
+            
+            # The remaining checks do substring scans, so lowercase just once for all of them
+            text_lower = text.lower()
+            
             # Check resume/CV keywords (enhanced detection)
-            if self.has_resume_keywords(text):
+            if self._has_resume_keywords_lower(text_lower):
                 logger.debug(f'Message excluded: contains resume/CV keywords')
                 return False
             
             # Check if it's a non-developer position
-            if self.has_non_developer_keywords(text):
+            if self._has_non_developer_keywords_lower(text_lower):
                 logger.debug(f'Message excluded: contains non-developer keywords')
                 return False
             
             # Check experience requirements
-            if not self.matches_experience_requirements(text):
+            if not self._matches_experience_lower(text_lower):
                 logger.debug(f'Message excluded: does not meet experience requirements')
                 return False
             
-            # Check remote work requirement
-            if not self.matches_remote_requirement(text):
-                logger.debug(f'Message excluded: no remote work mentioned')
-                return False
-            
             logger.debug('Message passed all filters successfully')
             return True
             
@@ -185,40 +273,51 @@ class RussianJobFilter:
             logger.error(f'Error filtering message: {e}')
             return False
     
+    def _lexicon_mask(self, text: str) -> int:
+        """Get the category bits of the lexicons found in text"""
+        mask = 0
+        for bit, pattern in self._lexicon_res:
+            if pattern.search(text):
+                mask |= bit
+        return mask
+    
     def matches_keywords(self, text: str) -> bool:
         """Check if text matches any of the configured keywords"""
-        if not text:
+        if not text or self._keyword_re is None:
             return False
-            
-        text_lower = text.lower()
         
-        for keyword in self.keywords:
-            if keyword in text_lower:
-                logger.debug(f'Keyword match found: {keyword} in message')
-                return True
+        # The combined pattern answers this on its own; the per-keyword pass
+        # is only needed by get_matched_keywords
+        match = self._keyword_re.search(text)
+        if match:
+            logger.debug(f'Keyword match found: {match.group(0).lower()} in message')
+            return True
         
         return False
     
+    def _find_keyword_matches(self, text: str) -> tuple:
+        """Scan text for configured keywords, in keyword order"""
+        if self._keyword_re is None or not self._keyword_re.search(text):
+            return ()
+        
+        text_lower = text.lower()
+        return tuple(keyword for keyword in self.keywords if keyword in text_lower)
+    
     def has_exclude_keywords(self, text: str) -> bool:
         """Check if text contains exclude keywords (senior/middle positions)"""
         if not text:
             return False
-            
-        text_lower = text.lower()
         
-        for exclude_keyword in self.exclude_keywords:
-            if exclude_keyword in text_lower:
-                return True
-        
-        return False
+        return self._exclude_re.search(text) is not None
     
     def has_resume_keywords(self, text: str) -> bool:
         """Check if text contains resume/CV keywords (enhanced detection)"""
         if not text:
             return False
-            
-        text_lower = text.lower()
         
+        return self._has_resume_keywords_lower(text.lower())
+    
+    def _has_resume_keywords_lower(self, text_lower: str) -> bool:
         # Check for resume keywords with context
         for resume_keyword in self.resume_exclude_keywords:
             if resume_keyword in text_lower:
@@ -252,13 +351,9 @@ class RussianJobFilter:
                     return True
         
         # Check for job-seeking language patterns
-        seeking_patterns = [
-            r'ищу\s+работу', r'looking\s+for\s+job', r'seeking\s+position',
-            r'открыт\s+к\s+предложениям', r'open\s+to\s+opportunities'
-        ]
-        for pattern in seeking_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.debug(f'Job-seeking pattern found: "{pattern}"')
+        for pattern in _SEEKING_PATTERNS:
+            if pattern.search(text):
+                logger.debug(f'Job-seeking pattern found: "{pattern.pattern}"')
                 return True
         
         return False
@@ -267,14 +362,15 @@ class RussianJobFilter:
         """Check if text contains keywords indicating non-developer positions"""
         if not text:
             return False
-            
-        text_lower = text.lower()
         
+        return self._has_non_developer_keywords_lower(text.lower())
+    
+    def _has_non_developer_keywords_lower(self, text_lower: str) -> bool:
         # Check for non-developer keywords
-        for non_dev_keyword in self.non_developer_keywords:
-            if non_dev_keyword in text_lower:
-                logger.debug(f'Found non-developer keyword: "{non_dev_keyword}"')
-                return True
+        match = self._non_developer_re.search(text_lower)
+        if match:
+            logger.debug(f'Found non-developer keyword: "{match.group(0)}"')
+            return True
         
         # Check for contextual keywords (web3, blockchain, etc.) - only reject if NOT combined with developer terms
         for contextual_keyword in self.contextual_keywords:
@@ -295,54 +391,57 @@ class RussianJobFilter:
         """Check if message matches experience requirements"""
         if not text:
             return False
-            
-        text_lower = text.lower()
         
+        return self._matches_experience_lower(text.lower())
+    
+    def _matches_experience_lower(self, text_lower: str) -> bool:
         # Check for strict junior keywords (only developer/engineer positions)
-        for junior_keyword in self.junior_keywords:
-            if junior_keyword in text_lower:
-                logger.debug(f'Found junior keyword: "{junior_keyword}"')
-                # Additional check: make sure it's not combined with non-developer keywords
-                if not self.has_non_developer_keywords(text_lower):
-                    logger.debug(f'Junior keyword "{junior_keyword}" confirmed for developer position')
-                    return True
-                else:
-                    logger.debug(f'Junior keyword "{junior_keyword}" found but combined with non-developer keywords - rejecting')
-                    return False
+        match = self._junior_re.search(text_lower)
+        if match:
+            junior_keyword = match.group(0)
+            logger.debug(f'Found junior keyword: "{junior_keyword}"')
+            # Additional check: make sure it's not combined with non-developer keywords
+            if not self._has_non_developer_keywords_lower(text_lower):
+                logger.debug(f'Junior keyword "{junior_keyword}" confirmed for developer position')
+                return True
+            else:
+                logger.debug(f'Junior keyword "{junior_keyword}" found but combined with non-developer keywords - rejecting')
+                return False
         
         # Check experience patterns
-        for pattern in self.experience_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            for match in matches:
-                try:
-                    years = int(match)
-                    logger.debug(f'Found experience requirement: {years} years')
-                    # Accept if experience is 2 years or less
-                    if years <= 2:
-                        logger.debug(f'Experience requirement {years} years is acceptable')
-                        return True
-                    else:
-                        logger.debug(f'Experience requirement {years} years is too high')
-                        return False
-                except ValueError:
-                    continue
+        years = self._find_experience_years(text_lower)
+        if years is not None:
+            logger.debug(f'Found experience requirement: {years} years')
+            # Accept if experience is 2 years or less
+            if years <= 2:
+                logger.debug(f'Experience requirement {years} years is acceptable')
+                return True
+            else:
+                logger.debug(f'Experience requirement {years} years is too high')
+                return False
         
         # If no experience mentioned and no junior keywords, accept (could be entry level)
         logger.debug('No specific experience requirements found, accepting as potential entry level')
         return True
     
+    def _find_experience_years(self, text: str) -> Optional[int]:
+        """Get the first experience requirement in years mentioned in text"""
+        match = self._experience_re.search(text)
+        if not match:
+            return None
+        
+        return int(next(group for group in match.groups() if group is not None))
+    
     def matches_remote_requirement(self, text: str) -> bool:
         """Check if message mentions remote work"""
         if not text:
             return False
             
-        text_lower = text.lower()
-        
         # Check for remote work keywords
-        for remote_keyword in self.remote_keywords:
-            if remote_keyword in text_lower:
-                logger.debug(f'Remote work keyword found: {remote_keyword}')
-                return True
+        match = self._remote_re.search(text)
+        if match:
+            logger.debug(f'Remote work keyword found: {match.group(0).lower()}')
+            return True
         
         return False
     
@@ -359,23 +458,22 @@ class RussianJobFilter:
         # Ensure both dates are timezone-aware or timezone-naive
         if message_date.tzinfo is None:
             # Make message_date timezone-aware
-            from datetime import timezone
             message_date = message_date.replace(tzinfo=timezone.utc)
             
-        cutoff_time = datetime.now(message_date.tzinfo) - timedelta(hours=self.date_filter_hours)
-        return message_date >= cutoff_time
+        return message_date >= self._date_cutoff()
+    
+    def _date_cutoff(self) -> datetime:
+        """Get the oldest accepted message date, refreshed every few seconds"""
+        tick = time.monotonic()
+        if self._cutoff is None or tick - self._cutoff_at > _CUTOFF_REFRESH_SECONDS:
+            self._cutoff = datetime.now(timezone.utc) - timedelta(hours=self.date_filter_hours)
+            self._cutoff_at = tick
+        return self._cutoff
     
     def _extract_message_text(self, message: Dict[str, Any]) -> str:
         """Extract text content from message"""
         # Handle different message types
-        if 'message' in message:
-            return message['message'] or ''
-        elif 'text' in message:
-            return message['text'] or ''
-        elif 'caption' in message:
-            return message['caption'] or ''
-        
-        return ''
+        return message.get('message') or message.get('text') or message.get('caption') or ''
     
     def _extract_message_date(self, message: Dict[str, Any]) -> datetime:
         """Extract date from message"""
@@ -392,15 +490,8 @@ class RussianJobFilter:
         """Get list of keywords that matched in the text"""
         if not text:
             return []
-            
-        text_lower = text.lower()
-        matched = []
-        
-        for keyword in self.keywords:
-            if keyword in text_lower:
-                matched.append(keyword)
         
-        return matched
+        return list(self._keyword_matches(text))
     
     def get_experience_info(self, text: str) -> Dict[str, Any]:
         """Extract experience information from text"""
@@ -409,25 +500,19 @@ class RussianJobFilter:
             
         text_lower = text.lower()
         
+        mask = self._lexicon_mask(text_lower)
+        
         # Check for strict junior keywords
-        junior_found = any(junior_keyword in text_lower for junior_keyword in self.junior_keywords)
+        junior_found = bool(mask & _JUNIOR)
         
         # Check for non-developer keywords
         non_dev_found = self.has_non_developer_keywords(text_lower)
         
         # Check for experience patterns
-        experience_years = None
-        for pattern in self.experience_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                try:
-                    experience_years = int(matches[0])
-                    break
-                except ValueError:
-                    continue
+        experience_years = self._find_experience_years(text_lower)
         
         # Check for remote work
-        remote_found = any(remote_keyword in text_lower for remote_keyword in self.remote_keywords)
+        remote_found = bool(mask & _REMOTE)
         
         return {
             'is_junior': junior_found and not non_dev_found,
@@ -525,22 +610,51 @@ class MessageFilter:
     def __init__(self, keywords: List[str], date_filter_hours: int = 24):
         self.keywords = [keyword.lower() for keyword in keywords]
         self.date_filter_hours = date_filter_hours
+        self._keyword_re = _compile_keyword_pattern(self.keywords)
+        # One pattern per keyword, so overlapping keywords ('python' and
+        # 'python developer') are each reported even where the combined
+        # pattern only consumes the longer one
+        self._keyword_word_res = [(keyword, _compile_keyword_pattern([keyword])) for keyword in self.keywords]
+        
+        # get_matched_keywords is often asked about the same reposted text
+        self._keyword_matches = lru_cache(maxsize=1024)(self._find_keyword_matches)
+        
+        # Cached date-filter cutoff and the monotonic time it was computed
+        self._cutoff = None
+        self._cutoff_at = 0.0
         
     def matches_keywords(self, text: str) -> bool:
         """Check if text matches any of the configured keywords"""
-        if not text:
+        if not text or self._keyword_re is None:
             return False
-            
-        text_lower = text.lower()
         
-        for keyword in self.keywords:
-            if keyword in text_lower:
-                logger.debug(f'Keyword match found: {keyword} in message')
-                return True
+        # The combined pattern answers this on its own; the per-keyword pass
+        # is only needed by get_matched_keywords
+        match = self._keyword_re.search(text)
+        if match:
+            logger.debug(f'Keyword match found: {match.group(0).lower()} in message')
+            return True
         
         return False
     
-    def matches_date_filter(self, message_date: datetime) -> bool:
+    def _find_keyword_matches(self, text: str) -> tuple:
+        """Scan text for configured keywords, in keyword order"""
+        if self._keyword_re is None:
+            return ()
+        
+        # Plain substring checks are far cheaper than the word-boundary
+        # pattern, and most messages contain none of the keywords at all
+        text_lower = text.lower()
+        if not any(keyword in text_lower for keyword in self.keywords):
+            return ()
+        
+        if not self._keyword_re.search(text):
+            return ()
+        
+        return tuple(keyword for keyword, pattern in self._keyword_word_res
+                     if keyword in text_lower and pattern.search(text))
+    
+    def matches_date_filter(self, message_date: datetime, cutoff_time: Optional[datetime] = None) -> bool:
         """Check if message is within the configured time window"""
         if self.date_filter_hours <= 0:
             return True  # No date filter
@@ -548,46 +662,55 @@ class MessageFilter:
         # Ensure both dates are timezone-aware or timezone-naive
         if message_date.tzinfo is None:
             # Make message_date timezone-aware
-            from datetime import timezone
             message_date = message_date.replace(tzinfo=timezone.utc)
-            
-        cutoff_time = datetime.now(message_date.tzinfo) - timedelta(hours=self.date_filter_hours)
+        
+        if cutoff_time is None:
+            cutoff_time = self._date_cutoff()
         return message_date >= cutoff_time
     
-    def filter_message(self, message: Dict[str, Any]) -> bool:
+    def _date_cutoff(self, now: Optional[datetime] = None) -> datetime:
+        """Get the oldest accepted message date relative to now"""
+        if now is None:
+            # Reuse the cutoff for a few seconds instead of reading the clock per message
+            tick = time.monotonic()
+            if self._cutoff is None or tick - self._cutoff_at > _CUTOFF_REFRESH_SECONDS:
+                self._cutoff = datetime.now(timezone.utc) - timedelta(hours=self.date_filter_hours)
+                self._cutoff_at = tick
+            return self._cutoff
+        
+        if now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+        return now - timedelta(hours=self.date_filter_hours)
+    
+    def filter_message(self, message: Dict[str, Any], cutoff_time: Optional[datetime] = None) -> bool:
         """Apply all filters to a message"""
         try:
+            # Check date filter first; stale messages skip the keyword scan
+            message_date = self._extract_message_date(message)
+            if not self.matches_date_filter(message_date, cutoff_time):
+                return False
+            
             # Extract message text
             text = self._extract_message_text(message)
             if not text:
                 return False
             
             # Check keyword filter
-            if not self.matches_keywords(text):
-                return False
-            
-            # Check date filter
-            message_date = self._extract_message_date(message)
-            if not self.matches_date_filter(message_date):
-                return False
-            
-            return True
+            return self.matches_keywords(text)
             
         except Exception as e:
             logger.error(f'Error filtering message: {e}')
             return False
     
+    def filter_messages(self, messages: List[Dict[str, Any]], now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Filter a batch of messages against a single cutoff time"""
+        cutoff_time = self._date_cutoff(now)
+        return [message for message in messages if self.filter_message(message, cutoff_time)]
+    
     def _extract_message_text(self, message: Dict[str, Any]) -> str:
         """Extract text content from message"""
         # Handle different message types
-        if 'message' in message:
-            return message['message'] or ''
-        elif 'text' in message:
-            return message['text'] or ''
-        elif 'caption' in message:
-            return message['caption'] or ''
-        
-        return ''
+        return message.get('message') or message.get('text') or message.get('caption') or ''
     
     def _extract_message_date(self, message: Dict[str, Any]) -> datetime:
         """Extract date from message"""
@@ -604,15 +727,8 @@ class MessageFilter:
         """Get list of keywords that matched in the text"""
         if not text:
             return []
-            
-        text_lower = text.lower()
-        matched = []
-        
-        for keyword in self.keywords:
-            if keyword in text_lower:
-                matched.append(keyword)
         
-        return matched
+        return list(self._keyword_matches(text))
 
 class AdvancedFilter(MessageFilter):
     """Advanced filter with additional capabilities"""
@@ -623,22 +739,23 @@ class AdvancedFilter(MessageFilter):
                  max_salary: Optional[int] = None):
         super().__init__(keywords, date_filter_hours)
         self.exclude_keywords = [kw.lower() for kw in (exclude_keywords or [])]
+        self._exclude_re = _compile_keyword_pattern(self.exclude_keywords, whole_word=False)
         self.min_salary = min_salary
         self.max_salary = max_salary
     
-    def filter_message(self, message: Dict[str, Any]) -> bool:
+    def filter_message(self, message: Dict[str, Any], cutoff_time: Optional[datetime] = None) -> bool:
         """Apply advanced filters to a message"""
         # First apply basic filters
-        if not super().filter_message(message):
+        if not super().filter_message(message, cutoff_time):
             return False
         
         text = self._extract_message_text(message)
-        text_lower = text.lower()
         
         # Check exclude keywords
-        for exclude_keyword in self.exclude_keywords:
-            if exclude_keyword in text_lower:
-                logger.debug(f'Excluded due to keyword: {exclude_keyword}')
+        if self._exclude_re is not None:
+            match = self._exclude_re.search(text)
+            if match:
+                logger.debug(f'Excluded due to keyword: {match.group(0).lower()}')
                 return False
         
         # Check salary range (if configured)
@@ -653,6 +770,10 @@ class AdvancedFilter(MessageFilter):
         if not (self.min_salary or self.max_salary):
             return True  # No salary filter, pass all
         
+        if not _mentions_salary(text):
+            logger.debug("No salary mentioned in text")
+            return True  # Nothing to compare, don't exclude
+        
         try:
             # Extract salaries using the enhanced salary extractor
             salaries = salary_extractor.extract_salaries(text)
@@ -3,8 +3,9 @@ import csv
 import sqlite3
 import logging
 import asyncio
+import threading
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from pathlib import Path
 
 from .config import config
@@ -246,12 +247,28 @@ class DatabaseManager:
     
     def __init__(self, db_path: str = None):
         self.db_path = db_path or config.database_path
+        # One connection per thread, opened on first use and kept open
+        self._local = threading.local()
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's database connection, opening it if needed"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            # WAL lets the web UI read while the scraper writes
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA cache_size=-65536')  # 64 MiB page cache
+            conn.execute('PRAGMA temp_store=MEMORY')  # sorts and GROUP BY temp tables
+            conn.execute('PRAGMA mmap_size=268435456')  # read pages through a 256 MiB map
+            self._local.conn = conn
+        return conn
+    
     def _init_database(self):
         """Initialize the database"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
             # Create jobs table
@@ -292,17 +309,38 @@ class DatabaseManager:
                 )
             ''')
             
+            # Indexes for the newest-first job listings, with and without the
+            # favorites filter; created on existing databases too. id breaks
+            # created_at ties so pages and cursors come straight off the index.
+            try:
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_created_id ON jobs(created_at DESC, id DESC)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_favorite_created_id ON jobs(favorite, created_at DESC, id DESC)')
+            except sqlite3.OperationalError as e:
+                # A jobs table created by OutputManager has no favorite column
+                logger.warning(f'Could not create job listing indexes: {e}')
+            
+            # Change counter for the jobs table, bumped by triggers on every
+            # write from any process or connection, including the scraper's
+            cursor.execute('CREATE TABLE IF NOT EXISTS jobs_version (version INTEGER NOT NULL)')
+            cursor.execute('INSERT INTO jobs_version (version) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM jobs_version)')
+            for event in ('INSERT', 'UPDATE', 'DELETE'):
+                cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS jobs_version_{event.lower()} AFTER {event} ON jobs
+                    BEGIN
+                        UPDATE jobs_version SET version = version + 1;
+                    END
+                ''')
+            
             conn.commit()
-            conn.close()
             logger.info(f'Database initialized: {self.db_path}')
             
         except Exception as e:
             logger.error(f'Failed to initialize database: {e}')
     
-    def get_jobs(self, limit: int = 100, favorite_only: bool = False) -> List[Dict[str, Any]]:
-        """Get jobs from database"""
+    def get_jobs(self, limit: int = 100, favorite_only: bool = False, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get a page of jobs from database"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
             query = 'SELECT * FROM jobs'
@@ -311,41 +349,116 @@ class DatabaseManager:
             if favorite_only:
                 query += ' WHERE favorite = TRUE'
             
-            query += ' ORDER BY created_at DESC LIMIT ?'
-            params.append(limit)
+            query += ' ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?'
+            params.extend([limit, offset])
             
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            # Convert to list of dictionaries
-            columns = [description[0] for description in cursor.description]
-            jobs = []
-            for row in rows:
-                job = dict(zip(columns, row))
-                # Parse matched_keywords JSON
-                if job['matched_keywords']:
-                    try:
-                        job['matched_keywords'] = json.loads(job['matched_keywords'])
-                    except:
-                        job['matched_keywords'] = []
-                jobs.append(job)
+            return self._rows_to_jobs(cursor)
             
-            conn.close()
-            return jobs
+        except Exception as e:
+            logger.error(f'Failed to get jobs from database: {e}')
+            return []
+    
+    def get_jobs_after(self, last_id: int, limit: int = 100,
+                       favorite_only: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """Get the jobs following last_id in get_jobs order, or None if last_id isn't a job"""
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT created_at FROM jobs WHERE id = ?', (last_id,))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            
+            # Seek past the cursor row through the created_at index rather
+            # than scanning and discarding an OFFSET's worth of rows
+            query = 'SELECT * FROM jobs WHERE (created_at, id) < (?, ?)'
+            params = [row[0], last_id]
+            
+            if favorite_only:
+                query += ' AND favorite = TRUE'
+            
+            query += ' ORDER BY created_at DESC, id DESC LIMIT ?'
+            params.append(limit)
+            
+            cursor.execute(query, params)
+            return self._rows_to_jobs(cursor)
             
         except Exception as e:
             logger.error(f'Failed to get jobs from database: {e}')
             return []
     
+    def _rows_to_jobs(self, cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+        """Convert fetched job rows to dictionaries"""
+        rows = cursor.fetchall()
+        
+        # Convert to list of dictionaries
+        columns = [description[0] for description in cursor.description]
+        jobs = []
+        for row in rows:
+            job = dict(zip(columns, row))
+            # Parse matched_keywords JSON
+            if job['matched_keywords']:
+                try:
+                    job['matched_keywords'] = json.loads(job['matched_keywords'])
+                except:
+                    job['matched_keywords'] = []
+            jobs.append(job)
+        
+        return jobs
+    
+    def iter_jobs(self, chunk_size: int = 500, favorite_only: bool = False) -> Iterator[List[Dict[str, Any]]]:
+        """Yield all jobs from database, chunk_size jobs at a time"""
+        # Each chunk seeks past the last one rather than re-skipping an
+        # ever larger OFFSET, so the whole walk stays linear in the table size
+        jobs = self.get_jobs(limit=chunk_size, favorite_only=favorite_only)
+        while jobs:
+            yield jobs
+            if len(jobs) < chunk_size:
+                return
+            jobs = self.get_jobs_after(jobs[-1]['id'], limit=chunk_size, favorite_only=favorite_only)
+    
+    def count_jobs(self, favorite_only: bool = False) -> int:
+        """Count jobs in database"""
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            
+            query = 'SELECT COUNT(*) FROM jobs'
+            if favorite_only:
+                query += ' WHERE favorite = TRUE'
+            
+            cursor.execute(query)
+            total_jobs = cursor.fetchone()[0]
+            
+            return total_jobs
+            
+        except Exception as e:
+            logger.error(f'Failed to count jobs in database: {e}')
+            return 0
+    
+    def get_jobs_version(self) -> Optional[int]:
+        """Get a counter that changes whenever jobs are added, changed or removed"""
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT version FROM jobs_version')
+            return cursor.fetchone()[0]
+            
+        except Exception as e:
+            logger.error(f'Failed to get jobs version: {e}')
+            return None
+    
     def toggle_favorite(self, job_id: int) -> bool:
         """Toggle favorite status of a job"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
             cursor.execute('UPDATE jobs SET favorite = NOT favorite WHERE id = ?', (job_id,))
             conn.commit()
-            conn.close()
             
             return True
             
@@ -356,7 +469,7 @@ class DatabaseManager:
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
             # Total jobs
@@ -381,8 +494,6 @@ class DatabaseManager:
             ''')
             top_channels = cursor.fetchall()
             
-            conn.close()
-            
             return {
                 'total_jobs': total_jobs,
                 'favorite_jobs': favorite_jobs,
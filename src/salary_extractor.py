@@ -11,14 +11,36 @@ from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
 import locale
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Use Google RE2 for the salary pattern when available; it matches in
+# linear time on any input
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 logger = logging.getLogger(__name__)
 
+# Period spellings accepted by SalaryRange, mapped to their normal form
+_PERIOD_ALIASES = {
+    'hour': 'hourly', 'hr': 'hourly', 'hourly': 'hourly',
+    'day': 'daily', 'daily': 'daily',
+    'week': 'weekly', 'weekly': 'weekly',
+    'month': 'monthly', 'mo': 'monthly', 'monthly': 'monthly',
+    'year': 'yearly', 'yr': 'yearly', 'annum': 'yearly', 'annual': 'yearly', 'yearly': 'yearly'
+}
+
 @dataclass
 class SalaryRange:
-    """Represents a salary range with currency and period information."""
-    min_amount: Optional[Decimal]
-    max_amount: Optional[Decimal]
+    """Represents a salary range with currency and period information.
+    
+    Whole amounts are stored as int and fractional ones as Decimal; the two
+    compare, hash and multiply interchangeably.
+    """
+    min_amount: Optional[Union[int, Decimal]]
+    max_amount: Optional[Union[int, Decimal]]
     currency: str
     period: str  # 'hourly', 'daily', 'weekly', 'monthly', 'yearly'
     is_range: bool
@@ -35,14 +57,7 @@ class SalaryRange:
         self.currency = self.currency.upper()
         
         # Normalize period
-        period_mapping = {
-            'hour': 'hourly', 'hr': 'hourly', 'hourly': 'hourly',
-            'day': 'daily', 'daily': 'daily',
-            'week': 'weekly', 'weekly': 'weekly',
-            'month': 'monthly', 'mo': 'monthly', 'monthly': 'monthly',
-            'year': 'yearly', 'yr': 'yearly', 'annum': 'yearly', 'annual': 'yearly', 'yearly': 'yearly'
-        }
-        self.period = period_mapping.get(self.period.lower(), 'yearly')
+        self.period = _PERIOD_ALIASES.get(self.period.lower(), 'yearly')
     
     def to_dict(self) -> Dict:
         """Convert to dictionary representation."""
@@ -62,60 +77,151 @@ class SalaryRange:
         else:
             return f"{self.min_amount} {self.currency} ({self.period})"
 
+# Factors converting a salary period to yearly
+_YEARLY_FACTORS = {
+    'hourly': 2080,  # 40 hours/week * 52 weeks
+    'daily': 260,    # 5 days/week * 52 weeks
+    'weekly': 52,    # 52 weeks/year
+    'monthly': 12    # 12 months/year
+}
+
+# Currency symbols and codes
+_CURRENCIES = {
+    '$': 'USD', '€': 'EUR', '£': 'GBP', '¥': 'JPY', '₹': 'INR',
+    '₽': 'RUB', '₴': 'UAH', '₸': 'KZT', '₿': 'BTC',
+    'usd': 'USD', 'eur': 'EUR', 'gbp': 'GBP', 'jpy': 'JPY',
+    'inr': 'INR', 'rub': 'RUB', 'uah': 'UAH', 'kzt': 'KZT', 'btc': 'BTC',
+    'dollar': 'USD', 'euro': 'EUR', 'pound': 'GBP',
+    'dollars': 'USD', 'euros': 'EUR', 'pounds': 'GBP',
+    'руб': 'RUB', 'рублей': 'RUB', 'рубля': 'RUB',
+    'гривен': 'UAH', 'гривна': 'UAH', 'гривны': 'UAH',
+    'тенге': 'KZT'
+}
+
+# Period keywords
+_PERIOD_KEYWORDS = {
+    'hourly': ['hour', 'hr', 'hourly', 'per hour', '/hr', '/hour'],
+    'daily': ['day', 'daily', 'per day', '/day'],
+    'weekly': ['week', 'weekly', 'per week', '/week'],
+    'monthly': ['month', 'mo', 'monthly', 'per month', '/month'],
+    'yearly': ['year', 'yr', 'annum', 'annual', 'yearly', 'per annum', 'per year', '/year', 'pa']
+}
+
+# Building blocks shared by the salary pattern alternatives. The amount
+# uses possessive quantifiers (Python 3.11+) so long digit runs that
+# don't lead to a salary fail fast instead of backtracking.
+# The 'k' suffix may run straight into a period or currency (45kpa,
+# 50kUSD) but not into more digits.
+_AMOUNT = r'(?:\d{1,3}+(?:,\d{3})++|\d++)(?:\.\d++)?(?:\s*+k(?![0-9]))?'
+# RE2 has no possessive quantifiers, and never backtracks anyway; it has
+# no lookahead either, so the suffix is taken unconditionally there
+_AMOUNT_RE2 = r'(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?:\s*k)?'
+_SYMBOL = r'[$€£¥₹₽₴₸₿]'
+_WORD = r'dollars?|euros?|pounds?|usd|eur|gbp|jpy|inr|rub|uah|kzt|btc|руб(?:лей|я)?|гривен?|тенге'
+_PERIOD = r'hour|day|week|month|year|annum|annual'
+_DASH = r'\s*[-–—]\s*'
+
+# Salary pattern alternatives, most specific first. Each alternative
+# is wrapped in a group named after it and uses {min}, {max}, {cur} and
+# {period} placeholders for the parts _parse_match reads back out.
+_SALARY_PATTERNS = [
+    # Complex patterns: salary between $50k and $80k
+    ('between', r'(?:salary|pay|compensation)\s+(?:between|from|range(?:\s+from)?)\s+'
+                r'{cur:symbol}\s*{min}\s*(?:and|to)\s+' + _SYMBOL + r'\s*{max}'),
+    
+    # Russian patterns: от 100000 до 200000 рублей
+    ('ru_range', r'от\s+{min}\s+до\s+{max}\s*{cur:word}'),
+    
+    # Range patterns: $50k-$80k, £50,000-80,000, 50k-80k €
+    ('symbol_range', r'{cur:symbol}\s*{min}' + _DASH + r'(?:' + _SYMBOL + r'\s*)?{max}'),
+    ('range_symbol', r'{min}' + _DASH + r'{max}\s*{cur:symbol}'),
+    
+    # Text range: 50k-80k USD, 100000-200000 рублей
+    ('range_word', r'{min}' + _DASH + r'{max}\s*{cur:word}'),
+    
+    # With period: $50k/year, £50,000 per annum
+    ('symbol_period', r'{cur:symbol}\s*{min}\s*(?:per\s+)?{period}'),
+    ('period_symbol', r'{min}\s*(?:per\s+)?{period}\s*{cur:symbol}'),
+    
+    # Basic patterns: $50k, £50,000, 50k €
+    ('symbol', r'{cur:symbol}\s*{min}'),
+    ('amount_symbol', r'{min}\s*{cur:symbol}'),
+    
+    # Text currency: 50k USD, 50,000 dollars
+    ('amount_word', r'{min}\s*{cur:word}'),
+]
+
+def _join_salary_patterns(amount: str) -> str:
+    """Join every alternative into one pattern so the text is scanned once."""
+    parts = {'symbol': _SYMBOL, 'word': _WORD}
+    alternatives = []
+    for name, template in _SALARY_PATTERNS:
+        pattern = (template
+                   .replace('{min}', f'(?P<{name}_min>{amount})')
+                   .replace('{max}', f'(?P<{name}_max>{amount})')
+                   .replace('{period}', f'(?P<{name}_period>{_PERIOD})'))
+        for kind, part in parts.items():
+            pattern = pattern.replace('{cur:' + kind + '}', f'(?P<{name}_cur>{part})')
+        alternatives.append(f'(?P<{name}>{pattern})')
+    return '|'.join(alternatives)
+
+# RE2's \s and \d are ASCII-only, where re's match any Unicode space or
+# digit (no-break and thin spaces, Arabic-Indic digits). Patterns handed
+# to RE2 spell the Unicode classes out so both engines match the same
+# text; \b and \w stay ASCII there, so patterns needing them stay on re.
+_RE2_UNICODE_CLASSES = {
+    r'\s': r'[\t-\r\x1c-\x1f\x85\p{Z}]',
+    r'\d': r'\p{Nd}',
+}
+_RE2_TOKEN_RE = re.compile(r'\[(?:\\.|[^\\\]])*\]|\\.')
+
+def _re2_unicode(pattern: str) -> str:
+    """Rewrite \\s and \\d outside character classes for RE2."""
+    return _RE2_TOKEN_RE.sub(lambda m: _RE2_UNICODE_CLASSES.get(m.group(), m.group()), pattern)
+
+def _compile_salary_pattern():
+    """Compile the combined salary pattern, with RE2 if installed."""
+    if re2 is not None:
+        try:
+            return re2.compile('(?i)' + _re2_unicode(_join_salary_patterns(_AMOUNT_RE2)))
+        except re2.error:
+            logger.debug('Salary pattern not supported by RE2, using re')
+    return re.compile(_join_salary_patterns(_AMOUNT), re.IGNORECASE)
+
+# Every alternative needs a currency symbol or word, so text containing none
+# of these can't match and skips the full pattern
+_CURRENCY_SYMBOLS = frozenset('$€£¥₹₽₴₸₿')
+_CURRENCY_WORD_STEMS = (
+    'dollar', 'eur', 'pound', 'usd', 'gbp', 'jpy', 'inr', 'rub', 'uah', 'kzt', 'btc',
+    'руб', 'грив', 'тенге'
+)
+
+def _has_currency(text: str) -> bool:
+    """Check whether text contains any currency symbol or word."""
+    if not _CURRENCY_SYMBOLS.isdisjoint(text):
+        return True
+    
+    text_lower = text.lower()
+    return any(stem in text_lower for stem in _CURRENCY_WORD_STEMS)
+
+# Every alternative also needs an amount, i.e. at least one digit
+_DIGIT_RE = re.compile(r'\d')
+
+# Names of the top-level alternatives, in priority order
+_SALARY_PATTERN_NAMES = tuple(name for name, _ in _SALARY_PATTERNS)
+
+# Compiled once at import; every SalaryExtractor shares it
+_SALARY_PATTERN = _compile_salary_pattern()
+
 class SalaryExtractor:
     """Advanced salary extraction from job posting text."""
     
     def __init__(self):
-        # Currency symbols and codes
-        self.currencies = {
-            '$': 'USD', '€': 'EUR', '£': 'GBP', '¥': 'JPY', '₹': 'INR',
-            '₽': 'RUB', '₴': 'UAH', '₸': 'KZT', '₿': 'BTC',
-            'usd': 'USD', 'eur': 'EUR', 'gbp': 'GBP', 'jpy': 'JPY',
-            'dollars': 'USD', 'euros': 'EUR', 'pounds': 'GBP',
-            'руб': 'RUB', 'рублей': 'RUB', 'рубля': 'RUB',
-            'гривен': 'UAH', 'гривна': 'UAH', 'гривны': 'UAH',
-            'тенге': 'KZT'
-        }
-        
-        # Period keywords
-        self.period_keywords = {
-            'hourly': ['hour', 'hr', 'hourly', 'per hour', '/hr', '/hour'],
-            'daily': ['day', 'daily', 'per day', '/day'],
-            'weekly': ['week', 'weekly', 'per week', '/week'],
-            'monthly': ['month', 'mo', 'monthly', 'per month', '/month'],
-            'yearly': ['year', 'yr', 'annum', 'annual', 'yearly', 'per annum', 'per year', '/year', 'pa']
-        }
-        
-        # Common salary patterns
-        self.salary_patterns = [
-            # Basic patterns: $50k, £50,000, €50k
-            r'([$€£¥₹₽₴₸₿])\s*(\d{1,3}(?:,\d{3})*(?:\s*k)?)',
-            r'(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*([$€£¥₹₽₴₸₿])',
-            
-            # Text currency: 50k USD, 50,000 dollars
-            r'(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*(usd|eur|gbp|jpy|inr|rub|uah|kzt|btc|dollars?|euros?|pounds?|руб(?:лей|я)?|гривен?|тенге)',
-            
-            # Range patterns: $50k-$80k, £50,000-80,000
-            r'([$€£¥₹₽₴₸₿])\s*(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*[-–—]\s*(\d{1,3}(?:,\d{3})*(?:\s*k)?)',
-            r'(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*[-–—]\s*(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*([$€£¥₹₽₴₸₿])',
-            
-            # Text range: 50k-80k USD
-            r'(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*[-–—]\s*(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*(usd|eur|gbp|jpy|inr|rub|uah|kzt|btc|dollars?|euros?|pounds?|руб(?:лей|я)?|гривен?|тенге)',
-            
-            # With period: $50k/year, £50,000 per annum
-            r'([$€£¥₹₽₴₸₿])\s*(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*(?:per\s+)?(hour|day|week|month|year|annum|annual)',
-            r'(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*(?:per\s+)?(hour|day|week|month|year|annum|annual)\s*([$€£¥₹₽₴₸₿])',
-            
-            # Complex patterns: salary between $50k and $80k
-            r'(?:salary|pay|compensation)\s+(?:between|from|range)\s+([$€£¥₹₽₴₸₿])\s*(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*(?:and|to)\s+([$€£¥₹₽₴₸₿])\s*(\d{1,3}(?:,\d{3})*(?:\s*k)?)',
-            
-            # Russian patterns: от 100000 до 200000 рублей
-            r'от\s+(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s+до\s+(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*(руб(?:лей|я)?|гривен?|тенге)',
-            r'(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*[-–—]\s*(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*(руб(?:лей|я)?|гривен?|тенге)',
-        ]
-        
-        # Compile patterns for better performance
-        self.compiled_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.salary_patterns]
+        # Lookup tables and the compiled pattern are module-level and shared
+        self.currencies = _CURRENCIES
+        self.period_keywords = _PERIOD_KEYWORDS
+        self.salary_patterns = _SALARY_PATTERNS
+        self.salary_pattern = _SALARY_PATTERN
     
     def extract_salaries(self, text: str) -> List[SalaryRange]:
         """
@@ -127,123 +233,80 @@ class SalaryExtractor:
         Returns:
             List of extracted salary ranges
         """
-        if not text:
+        if not text or not _has_currency(text) or not _DIGIT_RE.search(text):
             return []
         
         salaries = []
-        text_lower = text.lower()
         
-        # Try each pattern
-        for pattern in self.compiled_patterns:
-            matches = pattern.finditer(text)
-            for match in matches:
-                try:
-                    salary = self._parse_match(match, text)
-                    if salary:
-                        salaries.append(salary)
-                except Exception as e:
-                    logger.debug(f"Failed to parse salary match: {match.group()} - {e}")
+        for match in self.salary_pattern.finditer(text):
+            try:
+                salary = self._parse_match(match, text)
+                if salary:
+                    salaries.append(salary)
+            except Exception as e:
+                logger.debug(f"Failed to parse salary match: {match.group()} - {e}")
         
         # Remove duplicates and sort by amount
         unique_salaries = self._deduplicate_salaries(salaries)
         return sorted(unique_salaries, key=lambda s: s.min_amount or Decimal('0'))
     
-    def _parse_match(self, match: re.Match, original_text: str) -> Optional[SalaryRange]:
+    def _parse_match(self, match, original_text: str) -> Optional[SalaryRange]:
         """Parse a regex match into a SalaryRange object."""
-        groups = match.groups()
-        raw_text = match.group(0)
+        # The outermost group closes last, so with re lastgroup names the
+        # alternative; RE2's match objects don't guarantee that, so fall back
+        # to finding the alternative that took part in the match
+        name = match.lastgroup
+        if name not in _SALARY_PATTERN_NAMES:
+            name = next((name for name in _SALARY_PATTERN_NAMES if match.group(name) is not None), None)
+        if name is None:
+            return None
         
-        # Determine pattern type and extract values
-        if len(groups) == 2:
-            # Single amount: $50k or 50k USD
-            if groups[0] in self.currencies:
-                currency = self.currencies[groups[0]]
-                amount = self._parse_amount(groups[1])
-                period = self._detect_period(original_text, match.start())
-                return SalaryRange(
-                    min_amount=amount,
-                    max_amount=None,
-                    currency=currency,
-                    period=period,
-                    is_range=False,
-                    raw_text=raw_text
-                )
-            else:
-                amount = self._parse_amount(groups[0])
-                currency = self.currencies.get(groups[1].lower(), 'USD')
-                period = self._detect_period(original_text, match.start())
-                return SalaryRange(
-                    min_amount=amount,
-                    max_amount=None,
-                    currency=currency,
-                    period=period,
-                    is_range=False,
-                    raw_text=raw_text
-                )
+        min_amount = self._parse_amount(match.group(f'{name}_min'))
+        if min_amount is None:
+            return None
         
-        elif len(groups) == 3:
-            # Range: $50k-$80k or 50k-80k USD
-            if groups[0] in self.currencies:
-                currency = self.currencies[groups[0]]
-                min_amount = self._parse_amount(groups[1])
-                max_amount = self._parse_amount(groups[2])
-                period = self._detect_period(original_text, match.start())
-                return SalaryRange(
-                    min_amount=min_amount,
-                    max_amount=max_amount,
-                    currency=currency,
-                    period=period,
-                    is_range=True,
-                    raw_text=raw_text
-                )
-            else:
-                min_amount = self._parse_amount(groups[0])
-                max_amount = self._parse_amount(groups[1])
-                currency = self.currencies.get(groups[2].lower(), 'USD')
-                period = self._detect_period(original_text, match.start())
-                return SalaryRange(
-                    min_amount=min_amount,
-                    max_amount=max_amount,
-                    currency=currency,
-                    period=period,
-                    is_range=True,
-                    raw_text=raw_text
-                )
+        groups = match.groupdict()
+        max_str = groups.get(f'{name}_max')
+        max_amount = self._parse_amount(max_str) if max_str else None
         
-        elif len(groups) == 4:
-            # Complex range: $50k and $80k
-            currency = self.currencies[groups[0]]
-            min_amount = self._parse_amount(groups[1])
-            max_amount = self._parse_amount(groups[3])
-            period = self._detect_period(original_text, match.start())
-            return SalaryRange(
-                min_amount=min_amount,
-                max_amount=max_amount,
-                currency=currency,
-                period=period,
-                is_range=True,
-                raw_text=raw_text
-            )
+        currency = self.currencies.get(groups[f'{name}_cur'].lower(), 'USD')
+        period = groups.get(f'{name}_period') or self._detect_period(original_text, match.start())
         
-        return None
+        return SalaryRange(
+            min_amount=min_amount,
+            max_amount=max_amount,
+            currency=currency,
+            period=period,
+            is_range=max_str is not None,
+            raw_text=match.group(0)
+        )
     
-    def _parse_amount(self, amount_str: str) -> Optional[Decimal]:
-        """Parse amount string to Decimal."""
+    def _parse_amount(self, amount_str: str) -> Optional[Union[int, Decimal]]:
+        """Parse amount string to int, or Decimal if it has a fractional part."""
         if not amount_str:
             return None
         
-        # Remove commas and convert k to thousands
+        # Remove commas
         amount_str = amount_str.replace(',', '').strip()
         
-        # Handle 'k' suffix (thousands)
-        if amount_str.lower().endswith('k'):
-            amount_str = amount_str[:-1] + '000'
+        # Handle 'k' suffix (thousands), including fractional amounts like 1.5k
+        multiplier = 1
+        if amount_str[-1:] in ('k', 'K'):
+            amount_str = amount_str[:-1].strip()
+            multiplier = 1000
+        
+        # Most amounts are plain whole numbers; int is much cheaper than Decimal
+        if amount_str.isdecimal():
+            return int(amount_str) * multiplier
         
         try:
-            return Decimal(amount_str)
+            amount = Decimal(amount_str) * multiplier
         except (InvalidOperation, ValueError):
             logger.debug(f"Failed to parse amount: {amount_str}")
             return None
+        
+        # Amounts like 1.5k still come out whole
+        return int(amount) if amount == amount.to_integral_value() else amount
     
     def _detect_period(self, text: str, position: int) -> str:
         """Detect salary period from surrounding text."""
@@ -285,15 +348,7 @@ class SalaryExtractor:
         if salary.period == 'yearly':
             return salary
         
-        # Conversion factors
-        conversions = {
-            'hourly': 2080,  # 40 hours/week * 52 weeks
-            'daily': 260,    # 5 days/week * 52 weeks
-            'weekly': 52,    # 52 weeks/year
-            'monthly': 12    # 12 months/year
-        }
-        
-        factor = conversions.get(salary.period, 1)
+        factor = _YEARLY_FACTORS.get(salary.period, 1)
         
         if salary.min_amount:
             salary.min_amount *= factor
@@ -303,6 +358,29 @@ class SalaryExtractor:
         salary.period = 'yearly'
         return salary
     
+    def extract_salaries_batch(self, texts: List[str], max_workers: int = 1) -> List[List[SalaryRange]]:
+        """
+        Extract salaries from many texts, optionally across processes.
+        
+        Args:
+            texts: Job posting texts to analyze
+            max_workers: Number of worker processes; 1 runs serially in
+                this process, None uses one per CPU
+            
+        Returns:
+            List of extracted salary ranges for each text, in input order
+        """
+        if max_workers == 1 or len(texts) < 2:
+            return [self.extract_salaries(text) for text in texts]
+        
+        workers = max_workers or os.cpu_count() or 1
+        # A few chunks per worker keeps them busy without per-text IPC
+        chunksize = max(1, len(texts) // (4 * workers))
+        # Workers get a pickled copy of this extractor, so subclasses and
+        # customised lookup tables behave as they do serially
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.extract_salaries, texts, chunksize=chunksize))
+    
     def filter_by_range(self, salaries: List[SalaryRange], 
                        min_salary: Optional[Decimal] = None,
                        max_salary: Optional[Decimal] = None,
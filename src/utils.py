@@ -1,44 +1,64 @@
 import re
 import logging
 from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Characters clean_text keeps; everything else is stripped
+_CLEAN_KEEP_RE = re.compile(r'[\w\s\-.,!?£$€@#%&*()]')
+
+def _clean_keep(codepoint: int) -> Optional[int]:
+    """Translation of one codepoint for clean_text: itself if kept, else None"""
+    return codepoint if _CLEAN_KEEP_RE.match(chr(codepoint)) else None
+
+class _CleanTextTable(dict):
+    """str.translate table for clean_text, prebuilt for Latin-1"""
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        # Classified on the fly and not stored, so arbitrary Unicode input
+        # can't grow the table without bound
+        return _clean_keep(codepoint)
+
+_CLEAN_TEXT_TABLE = _CleanTextTable((codepoint, _clean_keep(codepoint)) for codepoint in range(256))
+
+# Job ads are often reposted verbatim across channels, so the pure text
+# helpers below memoize on the input text
+@lru_cache(maxsize=4096)
 def clean_text(text: str) -> str:
     """Clean and normalize text for better matching"""
     if not text:
         return ""
     
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
+    # Remove special characters that might interfere with matching,
+    # then collapse whitespace
+    text = text.translate(_CLEAN_TEXT_TABLE)
     
-    # Remove special characters that might interfere with matching
-    text = re.sub(r'[^\w\s\-.,!?£$€@#%&*()]', '', text)
-    
-    return text.lower()
+    return ' '.join(text.split()).lower()
+
+_SALARY_PATTERNS = [
+    # £50k, £50,000
+    (re.compile(r'£(\d{1,3}(?:,\d{3})*(?:\s*k)?)', re.IGNORECASE), 'GBP'),
+    # $50k, $50,000
+    (re.compile(r'\$(\d{1,3}(?:,\d{3})*(?:\s*k)?)', re.IGNORECASE), 'USD'),
+    # €50k, €50,000
+    (re.compile(r'€(\d{1,3}(?:,\d{3})*(?:\s*k)?)', re.IGNORECASE), 'EUR'),
+    # 50k pounds, 50,000 GBP
+    (re.compile(r'(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*(?:pounds?|gbp)', re.IGNORECASE), 'GBP'),
+    # 50k dollars, 50,000 USD
+    (re.compile(r'(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*(?:dollars?|usd)', re.IGNORECASE), 'USD'),
+]
 
 def extract_salary_info(text: str) -> Optional[Dict[str, Any]]:
     """Extract salary information from text"""
-    salary_patterns = [
-        # £50k, £50,000
-        (r'£(\d{1,3}(?:,\d{3})*(?:\s*k)?)', 'GBP'),
-        # $50k, $50,000
-        (r'\$(\d{1,3}(?:,\d{3})*(?:\s*k)?)', 'USD'),
-        # €50k, €50,000
-        (r'€(\d{1,3}(?:,\d{3})*(?:\s*k)?)', 'EUR'),
-        # 50k pounds, 50,000 GBP
-        (r'(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*(?:pounds?|gbp)', 'GBP'),
-        # 50k dollars, 50,000 USD
-        (r'(\d{1,3}(?:,\d{3})*(?:\s*k)?)\s*(?:dollars?|usd)', 'USD'),
-    ]
-    
-    for pattern, currency in salary_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
+    for pattern, currency in _SALARY_PATTERNS:
+        match = pattern.search(text)
+        if match:
             try:
                 # Convert to number
-                salary_str = matches[0].replace(',', '').replace('k', '000')
+                salary_str = match.group(1).replace(',', '').replace('k', '000')
                 salary = int(salary_str)
                 return {
                     'amount': salary,
@@ -50,96 +70,93 @@ def extract_salary_info(text: str) -> Optional[Dict[str, Any]]:
     
     return None
 
-def extract_contact_info(text: str) -> Dict[str, Any]:
+# Contact patterns. The UK (+44) and US (+1) formats are covered by the
+# general phone pattern, which requires a leading digit so runs of spaces
+# or dashes alone don't count as a number.
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'\+?\d[\d\s\-\(\)]{9,}', re.ASCII)
+_WEBSITE_RE = re.compile(r'https?://[^\s]+')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[^\s]+')
+
+@dataclass(frozen=True, slots=True)
+class ContactInfo:
+    """Contact details found in a job posting"""
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    website: Optional[str] = None
+    linkedin: Optional[str] = None
+
+def extract_contact_info(text: str) -> ContactInfo:
     """Extract contact information from text"""
-    contact_info = {
-        'email': None,
-        'phone': None,
-        'website': None,
-        'linkedin': None
-    }
-    
-    # Email patterns
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_match = re.search(email_pattern, text)
-    if email_match:
-        contact_info['email'] = email_match.group()
-    
-    # Phone patterns
-    phone_patterns = [
-        r'\+?[\d\s\-\(\)]{10,}',  # General phone pattern
-        r'\+44\s*\d{4}\s*\d{6}',  # UK format
-        r'\+1\s*\d{3}\s*\d{3}\s*\d{4}',  # US format
-    ]
-    
-    for pattern in phone_patterns:
-        phone_match = re.search(pattern, text)
-        if phone_match:
-            contact_info['phone'] = phone_match.group().strip()
-            break
-    
-    # Website patterns
-    website_pattern = r'https?://[^\s]+'
-    website_match = re.search(website_pattern, text)
-    if website_match:
-        contact_info['website'] = website_match.group()
+    email_match = _EMAIL_RE.search(text)
+    phone_match = _PHONE_RE.search(text)
+    website_match = _WEBSITE_RE.search(text)
+    linkedin_match = _LINKEDIN_RE.search(text)
     
-    # LinkedIn patterns
-    linkedin_pattern = r'linkedin\.com/in/[^\s]+'
-    linkedin_match = re.search(linkedin_pattern, text)
-    if linkedin_match:
-        contact_info['linkedin'] = linkedin_match.group()
-    
-    return contact_info
+    return ContactInfo(
+        email=email_match.group() if email_match else None,
+        phone=phone_match.group().strip() if phone_match else None,
+        website=website_match.group() if website_match else None,
+        linkedin=linkedin_match.group() if linkedin_match else None
+    )
+
+# Technology keywords recognised by extract_tech_stack
+_TECH_KEYWORDS = [
+    # Programming Languages
+    'python', 'javascript', 'typescript', 'java', 'c#', 'c++', 'go', 'rust', 'php', 'ruby', 'swift', 'kotlin',
+    # Frameworks
+    'react', 'vue', 'angular', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel', 'rails',
+    # Databases
+    'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'sqlite', 'oracle', 'sql server',
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab', 'github actions', 'terraform',
+    # Frontend
+    'html', 'css', 'sass', 'less', 'bootstrap', 'tailwind', 'webpack', 'vite', 'next.js', 'nuxt.js',
+    # Mobile
+    'react native', 'flutter', 'ionic', 'xamarin', 'swift ui', 'kotlin android',
+    # Other
+    'graphql', 'rest api', 'microservices', 'serverless', 'machine learning', 'ai', 'blockchain'
+]
+
+# Single-word terms are matched against the text's tokens; terms containing
+# spaces or dots can't be tokenized that way and fall back to substring checks
+_TECH_SINGLE_WORD = frozenset(tech for tech in _TECH_KEYWORDS if ' ' not in tech and '.' not in tech)
+_TECH_MULTIWORD = [tech for tech in _TECH_KEYWORDS if tech not in _TECH_SINGLE_WORD]
+_TECH_TOKEN_RE = re.compile(r'[a-z0-9#+]+')
 
 def extract_tech_stack(text: str) -> List[str]:
     """Extract technology stack from text"""
-    tech_keywords = [
-        # Programming Languages
-        'python', 'javascript', 'typescript', 'java', 'c#', 'c++', 'go', 'rust', 'php', 'ruby', 'swift', 'kotlin',
-        # Frameworks
-        'react', 'vue', 'angular', 'node.js', 'express', 'django', 'flask', 'spring', 'laravel', 'rails',
-        # Databases
-        'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'sqlite', 'oracle', 'sql server',
-        # Cloud & DevOps
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab', 'github actions', 'terraform',
-        # Frontend
-        'html', 'css', 'sass', 'less', 'bootstrap', 'tailwind', 'webpack', 'vite', 'next.js', 'nuxt.js',
-        # Mobile
-        'react native', 'flutter', 'ionic', 'xamarin', 'swift ui', 'kotlin android',
-        # Other
-        'graphql', 'rest api', 'microservices', 'serverless', 'machine learning', 'ai', 'blockchain'
-    ]
-    
-    found_tech = []
-    text_lower = text.lower()
-    
-    for tech in tech_keywords:
-        if tech in text_lower:
-            found_tech.append(tech)
+    return list(_tech_stack_from_lower(text.lower()))
+
+@lru_cache(maxsize=4096)
+def _tech_stack_from_lower(text_lower: str) -> tuple:
+    found = set(_TECH_TOKEN_RE.findall(text_lower)) & _TECH_SINGLE_WORD
+    found.update(tech for tech in _TECH_MULTIWORD if tech in text_lower)
     
-    return found_tech
+    # Keep results in keyword order
+    return tuple(tech for tech in _TECH_KEYWORDS if tech in found)
+
+# Common UK cities
+_UK_CITIES = [
+    'london', 'manchester', 'birmingham', 'leeds', 'liverpool', 'sheffield', 'bristol', 'glasgow',
+    'edinburgh', 'cardiff', 'newcastle', 'belfast', 'nottingham', 'leicester', 'cambridge', 'oxford'
+]
+
+# Common remote keywords
+_REMOTE_KEYWORDS = ['remote', 'work from home', 'wfh', 'hybrid', 'flexible working']
 
 def extract_location_info(text: str) -> Optional[str]:
     """Extract location information from text"""
-    # Common UK cities
-    uk_cities = [
-        'london', 'manchester', 'birmingham', 'leeds', 'liverpool', 'sheffield', 'bristol', 'glasgow',
-        'edinburgh', 'cardiff', 'newcastle', 'belfast', 'nottingham', 'leicester', 'cambridge', 'oxford'
-    ]
-    
-    # Common remote keywords
-    remote_keywords = ['remote', 'work from home', 'wfh', 'hybrid', 'flexible working']
-    
-    text_lower = text.lower()
-    
+    return _location_from_lower(text.lower())
+
+def _location_from_lower(text_lower: str) -> Optional[str]:
     # Check for remote work
-    for keyword in remote_keywords:
+    for keyword in _REMOTE_KEYWORDS:
         if keyword in text_lower:
             return 'Remote'
     
     # Check for UK cities
-    for city in uk_cities:
+    for city in _UK_CITIES:
         if city in text_lower:
             return city.title()
     
@@ -147,15 +164,14 @@ def extract_location_info(text: str) -> Optional[str]:
 
 def format_message_for_display(message: Dict[str, Any]) -> str:
     """Format a message for display purposes"""
-    text = message.get('message', '')[:200]
-    if len(message.get('message', '')) > 200:
-        text += "..."
-    
+    text = message.get('message', '') or ''
+    preview = text[:200] + ('...' if len(text) > 200 else '')
+
     date_str = message.get('date', 'Unknown')
     if hasattr(date_str, 'strftime'):
         date_str = date_str.strftime('%Y-%m-%d %H:%M')
-    
-    return f"[{date_str}] {message.get('chat_title', 'Unknown')}: {text}"
+
+    return f"[{date_str}] {message.get('chat_title', 'Unknown')}: {preview}"
 
 def calculate_message_stats(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Calculate statistics for a list of messages"""
@@ -167,22 +183,31 @@ def calculate_message_stats(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
             'avg_message_length': 0
         }
     
-    # Basic stats
+    # Gather channels, date bounds and total length in a single pass
     total_messages = len(messages)
-    unique_channels = len(set(msg.get('chat_title', 'Unknown') for msg in messages))
+    channels = set()
+    min_date = max_date = None
+    total_length = 0
+    
+    for msg in messages:
+        channels.add(msg.get('chat_title', 'Unknown'))
+        total_length += len(msg.get('message', ''))
+        
+        date = msg.get('date')
+        if date:
+            if min_date is None or date < min_date:
+                min_date = date
+            if max_date is None or date > max_date:
+                max_date = date
     
-    # Date range
-    dates = [msg.get('date') for msg in messages if msg.get('date')]
-    if dates:
-        min_date = min(dates)
-        max_date = max(dates)
+    unique_channels = len(channels)
+    
+    if min_date is not None:
         date_range = f"{min_date.strftime('%Y-%m-%d')} to {max_date.strftime('%Y-%m-%d')}"
     else:
         date_range = None
     
-    # Average message length
-    message_lengths = [len(msg.get('message', '')) for msg in messages]
-    avg_message_length = sum(message_lengths) / len(message_lengths) if message_lengths else 0
+    avg_message_length = total_length / total_messages
     
     return {
         'total_messages': total_messages,
@@ -204,15 +229,12 @@ def get_channel_id_from_username(username: str) -> Optional[str]:
     """Extract channel ID from username or URL"""
     # Remove @ if present
     username = username.lstrip('@')
-    
-    # Remove t.me/ prefix if present
-    if username.startswith('t.me/'):
-        username = username[5:]
-    
-    # Remove https://t.me/ prefix if present
-    if username.startswith('https://t.me/'):
-        username = username[13:]
-    
+
+    # Remove URL prefixes, longest first so the bare t.me/ form can't shadow them
+    username = username.removeprefix('https://t.me/')
+    username = username.removeprefix('http://t.me/')
+    username = username.removeprefix('t.me/')
+
     return username
 
 def create_backup_filename(prefix: str = 'backup') -> str:
@@ -236,8 +258,9 @@ def safe_json_load(filepath: str) -> Optional[Any]:
     """Safely load data from JSON file"""
     try:
         import json
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        from pathlib import Path
+        # Read the whole file at once and let json decode the UTF-8 bytes
+        data = json.loads(Path(filepath).read_bytes())
         logger.info(f'Data loaded from {filepath}')
         return data
     except Exception as e:
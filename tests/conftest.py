@@ -0,0 +1,12 @@
+import os
+import tempfile
+
+# src.config validates these at import time; give the database and web
+# tests placeholder credentials, keeping any real values already set
+os.environ.setdefault('API_ID', '12345')
+os.environ.setdefault('API_HASH', '0123456789abcdef0123456789abcdef')
+os.environ.setdefault('PHONE_NUMBER', '+1234567890')
+os.environ.setdefault('TARGET_CHANNELS', '-1001234567890')
+os.environ.setdefault('FILTER_KEYWORDS', 'python')
+os.environ.setdefault('TARGET_USER_ID', '1')
+os.environ.setdefault('DATABASE_PATH', os.path.join(tempfile.gettempdir(), 'telegram_job_scraper_test.db'))
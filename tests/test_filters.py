@@ -9,13 +9,39 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from filters import MessageFilter, AdvancedFilter, RussianJobFilter
 
+# Expected keyword matches, built once for the whole module
+EXPECTED_KEYWORDS_BASIC = frozenset({'python', 'react', 'remote'})
+EXPECTED_KEYWORDS_POSTING = frozenset({'python', 'react', 'remote', 'junior', 'aws'})
+
+# Message date well inside the 24h filter window, shared by parametrized cases
+RECENT_DATE = datetime.now() - timedelta(hours=6)
+
+JUNIOR_POSITIVE_CASES = (
+    "Junior Python developer needed",
+    "Джуниор разработчик Python",
+    "Intern position available",
+    "Стажер Python разработчик",
+    "Entry level developer",
+    "Начальный уровень разработки",
+)
+
+SENIOR_NEGATIVE_CASES = (
+    "Senior Python developer needed",
+    "Сеньор разработчик Python",
+    "Lead developer position",
+    "Team lead Python",
+    "Principal developer",
+    "Архитектор системы",
+)
+
 class TestMessageFilter:
     """Test cases for MessageFilter class"""
     
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.keywords = ['python', 'react', 'remote', 'junior']
-        self.filter = MessageFilter(self.keywords, date_filter_hours=24)
+    @classmethod
+    def setup_class(cls):
+        """Setup test fixtures once per class"""
+        cls.keywords = ['python', 'react', 'remote', 'junior']
+        cls.filter = MessageFilter(cls.keywords, date_filter_hours=24)
     
     def test_matches_keywords_positive(self):
         """Test keyword matching with positive cases"""
@@ -52,7 +78,12 @@ class TestMessageFilter:
         
         for text in test_cases:
             assert self.filter.matches_keywords(text) == True
-    
+
+    def test_matches_keywords_whole_word(self):
+        """Test that keywords only match as whole words"""
+        assert self.filter.matches_keywords("Reactive programming in Pythonic style") == False
+        assert self.filter.matches_keywords("Stack: React, Python.") == True
+
     def test_matches_date_filter_recent(self):
         """Test date filtering with recent messages"""
         recent_date = datetime.now() - timedelta(hours=12)
@@ -92,14 +123,43 @@ class TestMessageFilter:
             'date': datetime.now() - timedelta(hours=6)
         }
         assert self.filter.filter_message(recent_message) == False
-    
+
+    def test_filter_messages_batch(self):
+        """Test filtering a batch of messages against one cutoff"""
+        now = datetime.now()
+        messages = [
+            {'message': 'Python developer, remote', 'date': now - timedelta(hours=6)},
+            {'message': 'Python developer, remote', 'date': now - timedelta(hours=48)},
+            {'message': 'Java developer, office', 'date': now - timedelta(hours=6)},
+        ]
+
+        filtered = self.filter.filter_messages(messages, now=now)
+        assert filtered == [messages[0]]
+
     def test_get_matched_keywords(self):
         """Test getting matched keywords from text"""
         text = "We need a Python developer with React experience for remote work"
         matched = self.filter.get_matched_keywords(text)
-        expected = ['python', 'react', 'remote']
         
-        assert set(matched) == set(expected)
+        assert frozenset(matched) == EXPECTED_KEYWORDS_BASIC
+    
+    def test_get_matched_keywords_overlapping(self):
+        """Test overlapping keywords are all reported"""
+        message_filter = MessageFilter(['python', 'python developer', 'developer'])
+        
+        matched = message_filter.get_matched_keywords("Senior Python Developer wanted")
+        assert matched == ['python', 'python developer', 'developer']
+        
+        matched = message_filter.get_matched_keywords("Pythonic developer wanted")
+        assert matched == ['developer']
+    
+    def test_matches_keywords_uses_combined_pattern(self):
+        """Test the boolean check doesn't run the per-keyword pass"""
+        message_filter = MessageFilter(['python', 'react'])
+        message_filter._keyword_matches = None  # would raise if called
+        
+        assert message_filter.matches_keywords("Python developer wanted")
+        assert not message_filter.matches_keywords("Pythonic code")
     
     def test_extract_message_text(self):
         """Test message text extraction"""
@@ -118,13 +178,14 @@ class TestMessageFilter:
 class TestAdvancedFilter:
     """Test cases for AdvancedFilter class"""
     
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.keywords = ['python', 'react', 'remote']
-        self.exclude_keywords = ['senior', 'lead']
-        self.filter = AdvancedFilter(
-            keywords=self.keywords,
-            exclude_keywords=self.exclude_keywords,
+    @classmethod
+    def setup_class(cls):
+        """Setup test fixtures once per class"""
+        cls.keywords = ['python', 'react', 'remote']
+        cls.exclude_keywords = ['senior', 'lead']
+        cls.filter = AdvancedFilter(
+            keywords=cls.keywords,
+            exclude_keywords=cls.exclude_keywords,
             min_salary=30000,
             max_salary=80000
         )
@@ -218,54 +279,29 @@ class TestFilterIntegration:
         # Check matched keywords
         text = filter_obj._extract_message_text(job_posting)
         matched = filter_obj.get_matched_keywords(text)
-        expected_keywords = ['python', 'react', 'remote', 'junior', 'aws']
         
-        for keyword in expected_keywords:
-            assert keyword in matched
+        assert EXPECTED_KEYWORDS_POSTING <= frozenset(matched)
 
 class TestRussianJobFilter:
     """Test cases for RussianJobFilter class"""
     
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.keywords = ['python', 'react', 'remote', 'junior']
-        self.filter = RussianJobFilter(self.keywords, date_filter_hours=24)
+    @classmethod
+    def setup_class(cls):
+        """Setup test fixtures once per class"""
+        cls.keywords = ['python', 'react', 'remote', 'junior']
+        cls.filter = RussianJobFilter(cls.keywords, date_filter_hours=24)
     
-    def test_junior_keywords_positive(self):
+    @pytest.mark.parametrize("text", JUNIOR_POSITIVE_CASES)
+    def test_junior_keywords_positive(self, text):
         """Test that junior keywords are accepted"""
-        test_cases = [
-            "Junior Python developer needed",
-            "Джуниор разработчик Python",
-            "Intern position available",
-            "Стажер Python разработчик",
-            "Entry level developer",
-            "Начальный уровень разработки"
-        ]
-        
-        for text in test_cases:
-            message = {
-                'message': text,
-                'date': datetime.now() - timedelta(hours=6)
-            }
-            assert self.filter.filter_message(message) == True
+        message = {'message': text, 'date': RECENT_DATE}
+        assert self.filter.filter_message(message) == True
     
-    def test_senior_keywords_negative(self):
+    @pytest.mark.parametrize("text", SENIOR_NEGATIVE_CASES)
+    def test_senior_keywords_negative(self, text):
         """Test that senior keywords are excluded"""
-        test_cases = [
-            "Senior Python developer needed",
-            "Сеньор разработчик Python",
-            "Lead developer position",
-            "Team lead Python",
-            "Principal developer",
-            "Архитектор системы"
-        ]
-        
-        for text in test_cases:
-            message = {
-                'message': text,
-                'date': datetime.now() - timedelta(hours=6)
-            }
-            assert self.filter.filter_message(message) == False
+        message = {'message': text, 'date': RECENT_DATE}
+        assert self.filter.filter_message(message) == False
     
     def test_experience_requirements(self):
         """Test experience requirement filtering"""
@@ -372,9 +408,10 @@ class TestRussianJobFilter:
 class TestEnhancedSalaryFiltering:
     """Test enhanced salary filtering capabilities"""
     
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.filter = AdvancedFilter(
+    @classmethod
+    def setup_class(cls):
+        """Setup test fixtures once per class"""
+        cls.filter = AdvancedFilter(
             keywords=['python', 'developer'],
             min_salary=40000,
             max_salary=100000
@@ -0,0 +1,131 @@
+import pytest
+import sqlite3
+
+from src.output import DatabaseManager
+
+# Every job shares one created_at, so ordering and cursors rely on the id tie-break
+CREATED_AT = '2024-01-01 12:00:00'
+JOB_COUNT = 23
+
+def insert_jobs(db_path, count, created_at=CREATED_AT, first_telegram_id=0):
+    """Insert count jobs, every third one a favorite"""
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        'INSERT INTO jobs (telegram_id, message, chat_title, favorite, created_at) VALUES (?, ?, ?, ?, ?)',
+        [(i, f'Job {i}', 'Channel', i % 3 == 0, created_at)
+         for i in range(first_telegram_id, first_telegram_id + count)]
+    )
+    conn.commit()
+    conn.close()
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """DatabaseManager over a fresh database holding JOB_COUNT jobs"""
+    db_path = str(tmp_path / 'jobs.db')
+    manager = DatabaseManager(db_path)
+    insert_jobs(db_path, JOB_COUNT)
+    return manager
+
+class TestDatabaseManager:
+    """Test cases for DatabaseManager reads"""
+
+    def test_init_on_jobs_table_without_favorite(self, tmp_path):
+        """Test a jobs table created by OutputManager doesn't stop the other tables being created"""
+        db_path = str(tmp_path / 'jobs.db')
+        conn = sqlite3.connect(db_path)
+        conn.execute('CREATE TABLE jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, telegram_id INTEGER UNIQUE, '
+                     'message TEXT, created_at TEXT DEFAULT CURRENT_TIMESTAMP)')
+        conn.commit()
+
+        DatabaseManager(db_path)
+
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        conn.close()
+        assert {'jobs', 'keywords', 'channels'} <= tables
+
+    @pytest.mark.parametrize('favorite_only,expected', [(False, JOB_COUNT), (True, 8)])
+    def test_count_jobs(self, db_manager, favorite_only, expected):
+        """Test counting all and favorite jobs"""
+        assert db_manager.count_jobs(favorite_only=favorite_only) == expected
+
+    def test_get_jobs_order(self, db_manager):
+        """Test jobs come newest first, ties broken by id"""
+        ids = [job['id'] for job in db_manager.get_jobs(limit=100)]
+        assert ids == sorted(ids, reverse=True)
+
+    def test_get_jobs_offset(self, db_manager):
+        """Test offset pages continue where the previous page stopped"""
+        first = db_manager.get_jobs(limit=10)
+        second = db_manager.get_jobs(limit=10, offset=10)
+        assert [job['id'] for job in first + second] == [job['id'] for job in db_manager.get_jobs(limit=20)]
+
+    @pytest.mark.parametrize('favorite_only', [False, True])
+    @pytest.mark.parametrize('limit', [1, 5, 8, 100])
+    def test_keyset_walk(self, db_manager, favorite_only, limit):
+        """Test following get_jobs_after visits every job once, in order"""
+        expected = [job['id'] for job in db_manager.get_jobs(limit=100, favorite_only=favorite_only)]
+
+        seen = []
+        page = db_manager.get_jobs(limit=limit, favorite_only=favorite_only)
+        while page:
+            seen.extend(job['id'] for job in page)
+            page = db_manager.get_jobs_after(page[-1]['id'], limit=limit, favorite_only=favorite_only)
+
+        assert seen == expected
+
+    def test_keyset_across_timestamps(self, db_manager):
+        """Test the cursor seeks on created_at before id"""
+        # A later day sorts first whatever the ids; the older jobs follow
+        insert_jobs(db_manager.db_path, 3, created_at='2024-01-02 12:00:00', first_telegram_id=JOB_COUNT)
+        newer = [job['id'] for job in db_manager.get_jobs(limit=3)]
+
+        after = db_manager.get_jobs_after(newer[-1], limit=100)
+        assert len(after) == JOB_COUNT
+        assert not set(newer) & {job['id'] for job in after}
+
+    def test_get_jobs_after_last(self, db_manager):
+        """Test nothing follows the oldest job"""
+        oldest = db_manager.get_jobs(limit=100)[-1]
+        assert db_manager.get_jobs_after(oldest['id']) == []
+
+    def test_get_jobs_after_unknown(self, db_manager):
+        """Test a cursor naming no job reads as None, not as an empty page"""
+        assert db_manager.get_jobs_after(10 ** 6) is None
+
+    @pytest.mark.parametrize('chunk_size', [1, 7, JOB_COUNT, 50])
+    def test_iter_jobs(self, db_manager, chunk_size):
+        """Test iter_jobs yields every job once, in chunks of at most chunk_size"""
+        chunks = list(db_manager.iter_jobs(chunk_size=chunk_size))
+
+        assert all(0 < len(chunk) <= chunk_size for chunk in chunks)
+        assert [job['id'] for chunk in chunks for job in chunk] == \
+            [job['id'] for job in db_manager.get_jobs(limit=100)]
+
+    def test_jobs_version_changes_on_writes(self, db_manager):
+        """Test the version moves on every insert, update and delete, but not on reads"""
+        version = db_manager.get_jobs_version()
+        db_manager.get_jobs(limit=10)
+        assert db_manager.get_jobs_version() == version
+
+        # Moving a favorite keeps the count and the favorites total the same
+        jobs = db_manager.get_jobs(limit=2)
+        db_manager.toggle_favorite(jobs[0]['id'])
+        db_manager.toggle_favorite(jobs[1]['id'])
+        assert db_manager.get_jobs_version() == version + 2
+
+        # Writes from another connection, like the scraper's, count too
+        insert_jobs(db_manager.db_path, 1, first_telegram_id=JOB_COUNT)
+        conn = sqlite3.connect(db_manager.db_path)
+        conn.execute('DELETE FROM jobs WHERE telegram_id = ?', (JOB_COUNT,))
+        conn.commit()
+        conn.close()
+        assert db_manager.get_jobs_version() == version + 4
+
+    def test_jobs_version_unavailable(self, db_manager):
+        """Test a missing version table reads as None rather than a fixed value"""
+        conn = sqlite3.connect(db_manager.db_path)
+        conn.execute('DROP TABLE jobs_version')
+        conn.commit()
+        conn.close()
+
+        assert db_manager.get_jobs_version() is None
@@ -15,6 +15,18 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from salary_extractor import SalaryExtractor, SalaryRange, extract_salary_from_text, extract_salary_range
 
+@pytest.fixture(scope='module')
+def extractor():
+    """Shared extractor; extraction doesn't mutate it."""
+    return SalaryExtractor()
+
+class CadExtractor(SalaryExtractor):
+    """Extractor that reads '$' as Canadian dollars."""
+
+    def __init__(self):
+        super().__init__()
+        self.currencies = {**self.currencies, '$': 'CAD'}
+
 class TestSalaryRange:
     """Test cases for SalaryRange dataclass."""
     
@@ -140,132 +152,166 @@ class TestSalaryRange:
 class TestSalaryExtractor:
     """Test cases for SalaryExtractor class."""
     
-    def setup_method(self):
-        """Setup test fixtures."""
-        self.extractor = SalaryExtractor()
-    
-    def test_basic_currency_patterns(self):
+    @pytest.mark.parametrize('text,expected_currency', [
+        ('$50k', 'USD'),
+        ('£50,000', 'GBP'),
+        ('€50k', 'EUR'),
+        ('¥50000', 'JPY'),
+        ('₽50000', 'RUB'),
+        ('₴50000', 'UAH'),
+        ('₸50000', 'KZT'),
+        ('₿50000', 'BTC'),
+    ])
+    def test_basic_currency_patterns(self, extractor, text, expected_currency):
         """Test basic currency symbol patterns."""
-        test_cases = [
-            ('$50k', 'USD'),
-            ('£50,000', 'GBP'),
-            ('€50k', 'EUR'),
-            ('¥50000', 'JPY'),
-            ('₽50000', 'RUB'),
-            ('₴50000', 'UAH'),
-            ('₸50000', 'KZT'),
-            ('₿50000', 'BTC'),
-        ]
-        
-        for text, expected_currency in test_cases:
-            salaries = self.extractor.extract_salaries(text)
-            assert len(salaries) > 0
-            assert salaries[0].currency == expected_currency
+        salaries = extractor.extract_salaries(text)
+        assert len(salaries) > 0
+        assert salaries[0].currency == expected_currency
     
-    def test_text_currency_patterns(self):
+    @pytest.mark.parametrize('text,expected_currency', [
+        ('50k USD', 'USD'),
+        ('50,000 dollars', 'USD'),
+        ('50k EUR', 'EUR'),
+        ('50,000 euros', 'EUR'),
+        ('50k GBP', 'GBP'),
+        ('50,000 pounds', 'GBP'),
+        ('50000 рублей', 'RUB'),
+        ('50000 гривен', 'UAH'),
+        ('50000 тенге', 'KZT'),
+    ])
+    def test_text_currency_patterns(self, extractor, text, expected_currency):
         """Test text-based currency patterns."""
-        test_cases = [
-            ('50k USD', 'USD'),
-            ('50,000 dollars', 'USD'),
-            ('50k EUR', 'EUR'),
-            ('50,000 euros', 'EUR'),
-            ('50k GBP', 'GBP'),
-            ('50,000 pounds', 'GBP'),
-            ('50000 рублей', 'RUB'),
-            ('50000 гривен', 'UAH'),
-            ('50000 тенге', 'KZT'),
-        ]
-        
-        for text, expected_currency in test_cases:
-            salaries = self.extractor.extract_salaries(text)
-            assert len(salaries) > 0
-            assert salaries[0].currency == expected_currency
+        salaries = extractor.extract_salaries(text)
+        assert len(salaries) > 0
+        assert salaries[0].currency == expected_currency
     
-    def test_salary_ranges(self):
+    @pytest.mark.parametrize('text,expected_min,expected_max', [
+        ('$50k-$80k', 50000, 80000),
+        ('£50,000-80,000', 50000, 80000),
+        ('50k-80k USD', 50000, 80000),
+        ('от 100000 до 200000 рублей', 100000, 200000),
+    ])
+    def test_salary_ranges(self, extractor, text, expected_min, expected_max):
         """Test salary range extraction."""
-        test_cases = [
-            ('$50k-$80k', 50000, 80000),
-            ('£50,000-80,000', 50000, 80000),
-            ('50k-80k USD', 50000, 80000),
-            ('от 100000 до 200000 рублей', 100000, 200000),
-        ]
-        
-        for text, expected_min, expected_max in test_cases:
-            salaries = self.extractor.extract_salaries(text)
-            assert len(salaries) > 0
-            salary = salaries[0]
-            assert salary.is_range is True
-            assert salary.min_amount == Decimal(str(expected_min))
-            assert salary.max_amount == Decimal(str(expected_max))
+        salaries = extractor.extract_salaries(text)
+        assert len(salaries) > 0
+        salary = salaries[0]
+        assert salary.is_range is True
+        assert salary.min_amount == Decimal(str(expected_min))
+        assert salary.max_amount == Decimal(str(expected_max))
+
+    @pytest.mark.parametrize('text,expected_min,expected_currency', [
+        ('£45kpa', 45000, 'GBP'),
+        ('$50kUSD', 50000, 'USD'),
+    ])
+    def test_k_suffix_before_letters(self, extractor, text, expected_min, expected_currency):
+        """Test a 'k' running into a period or currency still multiplies."""
+        salaries = extractor.extract_salaries(text)
+        assert len(salaries) > 0
+        assert salaries[0].min_amount == Decimal(str(expected_min))
+        assert salaries[0].currency == expected_currency
+
+    @pytest.mark.parametrize('text,expected_min', [
+        ('50k\u00a0USD', 50000),
+        ('$50k\u2009-\u2009$80k', 50000),
+        ('٥٠k USD', 50000),
+        ('от\u00a0100000\u00a0до 200000 рублей', 100000),
+    ])
+    def test_unicode_spaces_and_digits(self, extractor, text, expected_min):
+        """Test no-break/thin spaces and non-ASCII digits, with re or RE2."""
+        salaries = extractor.extract_salaries(text)
+        assert len(salaries) > 0
+        assert salaries[0].min_amount == Decimal(str(expected_min))
+
+    def test_re2_unicode_classes(self):
+        """Test the RE2 pattern matches the Unicode spaces re's \\s does."""
+        re2 = pytest.importorskip('re2')
+        from salary_extractor import _AMOUNT_RE2, _join_salary_patterns, _re2_unicode
+
+        pattern = _join_salary_patterns(_AMOUNT_RE2)
+        text = '50k\u00a0USD'
+        # Plain RE2 \s is ASCII-only and misses the no-break space
+        assert re2.compile('(?i)' + pattern).fullmatch(text) is None
+        assert re2.compile('(?i)' + _re2_unicode(pattern)).fullmatch(text) is not None
+        assert re2.compile(_re2_unicode(r'looking\s+for\s+job')).search('looking\u00a0for\u2009job')
     
-    def test_period_detection(self):
+    @pytest.mark.parametrize('text,expected_period', [
+        ('$50/hour', 'hourly'),
+        ('$50 per hour', 'hourly'),
+        ('$50/hr', 'hourly'),
+        ('$1000/day', 'daily'),
+        ('$1000 per day', 'daily'),
+        ('$5000/week', 'weekly'),
+        ('$5000 per week', 'weekly'),
+        ('$10000/month', 'monthly'),
+        ('$10000 per month', 'monthly'),
+        ('$50000/year', 'yearly'),
+        ('$50000 per annum', 'yearly'),
+        ('$50000 pa', 'yearly'),
+    ])
+    def test_period_detection(self, extractor, text, expected_period):
         """Test salary period detection."""
-        test_cases = [
-            ('$50/hour', 'hourly'),
-            ('$50 per hour', 'hourly'),
-            ('$50/hr', 'hourly'),
-            ('$1000/day', 'daily'),
-            ('$1000 per day', 'daily'),
-            ('$5000/week', 'weekly'),
-            ('$5000 per week', 'weekly'),
-            ('$10000/month', 'monthly'),
-            ('$10000 per month', 'monthly'),
-            ('$50000/year', 'yearly'),
-            ('$50000 per annum', 'yearly'),
-            ('$50000 pa', 'yearly'),
-        ]
-        
-        for text, expected_period in test_cases:
-            salaries = self.extractor.extract_salaries(text)
-            assert len(salaries) > 0
-            assert salaries[0].period == expected_period
+        salaries = extractor.extract_salaries(text)
+        assert len(salaries) > 0
+        assert salaries[0].period == expected_period
     
-    def test_complex_patterns(self):
+    @pytest.mark.parametrize('text', [
+        'Salary between $50k and $80k',
+        'Pay range from $50,000 to $80,000',
+        'Compensation: $50k-$80k USD',
+        'Зарплата от 100000 до 200000 рублей',
+    ])
+    def test_complex_patterns(self, extractor, text):
         """Test complex salary patterns."""
-        test_cases = [
-            'Salary between $50k and $80k',
-            'Pay range from $50,000 to $80,000',
-            'Compensation: $50k-$80k USD',
-            'Зарплата от 100000 до 200000 рублей',
-        ]
-        
-        for text in test_cases:
-            salaries = self.extractor.extract_salaries(text)
-            assert len(salaries) > 0
-            assert salaries[0].is_range is True
+        salaries = extractor.extract_salaries(text)
+        assert len(salaries) > 0
+        assert salaries[0].is_range is True
     
-    def test_amount_parsing(self):
+    @pytest.mark.parametrize('amount_str,expected', [
+        ('50k', 50000),
+        ('50,000', 50000),
+        ('50000', 50000),
+        ('1.5k', 1500),
+        ('100k', 100000),
+    ])
+    def test_amount_parsing(self, extractor, amount_str, expected):
         """Test amount parsing with various formats."""
-        test_cases = [
-            ('50k', 50000),
-            ('50,000', 50000),
-            ('50000', 50000),
-            ('1.5k', 1500),
-            ('100k', 100000),
-        ]
-        
-        for amount_str, expected in test_cases:
-            result = self.extractor._parse_amount(amount_str)
-            assert result == Decimal(str(expected))
+        result = extractor._parse_amount(amount_str)
+        assert result == Decimal(str(expected))
     
-    def test_invalid_amounts(self):
+    @pytest.mark.parametrize('amount_str', ['', 'abc', 'k', '50abc', 'abc50'])
+    def test_invalid_amounts(self, extractor, amount_str):
         """Test handling of invalid amounts."""
-        invalid_amounts = ['', 'abc', 'k', '50abc', 'abc50']
-        
-        for amount_str in invalid_amounts:
-            result = self.extractor._parse_amount(amount_str)
-            assert result is None
+        result = extractor._parse_amount(amount_str)
+        assert result is None
     
-    def test_deduplication(self):
+    def test_deduplication(self, extractor):
         """Test salary deduplication."""
         text = "Salary: $50k, also $50k, and $50k again"
-        salaries = self.extractor.extract_salaries(text)
+        salaries = extractor.extract_salaries(text)
         
         # Should only have one unique salary
         assert len(salaries) == 1
         assert salaries[0].min_amount == Decimal('50000')
-    
-    def test_normalize_to_yearly(self):
+
+    def test_extract_salaries_batch(self, extractor):
+        """Test batch extraction keeps input order."""
+        texts = ["Salary: $50k", "No salary here", "£40,000 per annum"]
+        results = extractor.extract_salaries_batch(texts)
+
+        assert results == [extractor.extract_salaries(text) for text in texts]
+        assert results[1] == []
+
+    def test_extract_salaries_batch_workers(self):
+        """Test worker processes use the extractor they were called on."""
+        extractor = CadExtractor()
+        texts = ["Salary: $50k", "No salary here", "£40,000 per annum", "$60k-$70k"]
+        results = extractor.extract_salaries_batch(texts, max_workers=2)
+
+        assert results == [extractor.extract_salaries(text) for text in texts]
+        assert results[0][0].currency == 'CAD'
+
+    def test_normalize_to_yearly(self, extractor):
         """Test salary normalization to yearly."""
         test_cases = [
             (SalaryRange(Decimal('25'), None, 'USD', 'hourly', False, ''), 52000),  # 25 * 2080
@@ -276,11 +322,11 @@ class TestSalaryExtractor:
         ]
         
         for salary, expected_yearly in test_cases:
-            normalized = self.extractor.normalize_to_yearly(salary)
+            normalized = extractor.normalize_to_yearly(salary)
             assert normalized.period == 'yearly'
             assert normalized.min_amount == Decimal(str(expected_yearly))
     
-    def test_filter_by_range(self):
+    def test_filter_by_range(self, extractor):
         """Test salary filtering by range."""
         salaries = [
             SalaryRange(Decimal('30000'), None, 'USD', 'yearly', False, ''),
@@ -289,15 +335,15 @@ class TestSalaryExtractor:
         ]
         
         # Filter by min salary
-        filtered = self.extractor.filter_by_range(salaries, min_salary=Decimal('40000'))
+        filtered = extractor.filter_by_range(salaries, min_salary=Decimal('40000'))
         assert len(filtered) == 2  # 50k and 80k
         
         # Filter by max salary
-        filtered = self.extractor.filter_by_range(salaries, max_salary=Decimal('60000'))
+        filtered = extractor.filter_by_range(salaries, max_salary=Decimal('60000'))
         assert len(filtered) == 2  # 30k and 50k
         
         # Filter by range
-        filtered = self.extractor.filter_by_range(salaries, 
+        filtered = extractor.filter_by_range(salaries, 
                                                  min_salary=Decimal('40000'),
                                                  max_salary=Decimal('60000'))
         assert len(filtered) == 1  # Only 50k
@@ -337,37 +383,33 @@ class TestConvenienceFunctions:
 class TestEdgeCases:
     """Test edge cases and error handling."""
     
-    def test_empty_text(self):
+    def test_empty_text(self, extractor):
         """Test handling of empty text."""
-        extractor = SalaryExtractor()
         result = extractor.extract_salaries("")
         assert result == []
         
         result = extractor.extract_salaries(None)
         assert result == []
     
-    def test_malformed_patterns(self):
+    def test_malformed_patterns(self, extractor):
         """Test handling of malformed salary patterns."""
         text = "Salary: $abc, £def, €ghi"
-        extractor = SalaryExtractor()
         result = extractor.extract_salaries(text)
         
         # Should handle gracefully without crashing
         assert isinstance(result, list)
     
-    def test_very_large_numbers(self):
+    def test_very_large_numbers(self, extractor):
         """Test handling of very large salary numbers."""
         text = "Salary: $999999999999999"
-        extractor = SalaryExtractor()
         result = extractor.extract_salaries(text)
         
         assert len(result) > 0
         assert result[0].min_amount == Decimal('999999999999999')
     
-    def test_mixed_currencies(self):
+    def test_mixed_currencies(self, extractor):
         """Test handling of mixed currencies in same text."""
         text = "Salary: $50k USD or £40k GBP"
-        extractor = SalaryExtractor()
         result = extractor.extract_salaries(text)
         
         assert len(result) >= 2
@@ -378,7 +420,7 @@ class TestEdgeCases:
 class TestRealWorldExamples:
     """Test with real-world job posting examples."""
     
-    def test_real_job_posting_1(self):
+    def test_real_job_posting_1(self, extractor):
         """Test with a realistic job posting."""
         text = """
         🚀 Junior Python Developer Wanted!
@@ -393,8 +435,6 @@ class TestRealWorldExamples:
         Salary: £45,000 - £55,000 per annum
         Location: Remote (UK-based)
         """
-        
-        extractor = SalaryExtractor()
         result = extractor.extract_salaries(text)
         
         assert len(result) > 0
@@ -405,7 +445,7 @@ class TestRealWorldExamples:
         assert salary.currency == 'GBP'
         assert salary.period == 'yearly'
     
-    def test_real_job_posting_2(self):
+    def test_real_job_posting_2(self, extractor):
         """Test with another realistic job posting."""
         text = """
         Senior React Developer
@@ -418,8 +458,6 @@ class TestRealWorldExamples:
         Compensation: $120k - $150k USD annually
         Benefits: Health, dental, 401k
         """
-        
-        extractor = SalaryExtractor()
         result = extractor.extract_salaries(text)
         
         assert len(result) > 0
@@ -430,7 +468,7 @@ class TestRealWorldExamples:
         assert salary.currency == 'USD'
         assert salary.period == 'yearly'
     
-    def test_russian_job_posting(self):
+    def test_russian_job_posting(self, extractor):
         """Test with Russian job posting."""
         text = """
         Требуется Python разработчик
@@ -443,8 +481,6 @@ class TestRealWorldExamples:
         
         Зарплата: от 150000 до 250000 рублей
         """
-        
-        extractor = SalaryExtractor()
         result = extractor.extract_salaries(text)
         
         assert len(result) > 0
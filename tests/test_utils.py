@@ -0,0 +1,72 @@
+import pytest
+import dataclasses
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import utils
+from utils import ContactInfo, clean_text, extract_contact_info
+
+class TestCleanText:
+    """Test cases for clean_text"""
+
+    @pytest.mark.parametrize('text,expected', [
+        ('Hello,   World!! 🚀 <b>Python</b>', 'hello, world!! bpythonb'),
+        ('Salary £50k / $60k / €70k', 'salary £50k $60k €70k'),
+        ('Ünïcode  TEXT\tmixed\n', 'ünïcode text mixed'),
+        ('email@example.com #hiring (remote) 100%', 'email@example.com #hiring (remote) 100%'),
+    ])
+    def test_clean_text(self, text, expected):
+        """Test stripping symbols, collapsing whitespace and lowercasing"""
+        assert clean_text(text) == expected
+
+    def test_clean_text_table_bounded(self):
+        """Test characters outside Latin-1 aren't added to the translate table"""
+        table_size = len(utils._CLEAN_TEXT_TABLE)
+
+        assert clean_text('Привет 世界 🚀 ' + ''.join(map(chr, range(0x4E00, 0x4F00)))).startswith('привет 世界')
+        assert len(utils._CLEAN_TEXT_TABLE) == table_size
+
+    @pytest.mark.parametrize('text', ['', '   ', '🚀 ✨'])
+    def test_clean_text_empty(self, text):
+        """Test text with nothing left to keep"""
+        assert clean_text(text) == ''
+
+class TestContactInfo:
+    """Test cases for extract_contact_info"""
+
+    def test_all_fields(self):
+        """Test extracting every contact field"""
+        text = ('Email jobs@example.com or call +44 20 7946 0958. '
+                'More at https://example.com/jobs and linkedin.com/in/jane-doe')
+
+        assert extract_contact_info(text) == ContactInfo(
+            email='jobs@example.com',
+            phone='+44 20 7946 0958',
+            website='https://example.com/jobs',
+            linkedin='linkedin.com/in/jane-doe'
+        )
+
+    @pytest.mark.parametrize('text,expected', [
+        ('UK: +44 20 7946 0958', '+44 20 7946 0958'),
+        ('US: +1 (555) 123-4567', '+1 (555) 123-4567'),
+        ('Call 020 7946 0958 now', '020 7946 0958'),
+        ('Separator ---------- only', None),
+        ('Call me maybe', None),
+    ])
+    def test_phone(self, text, expected):
+        """Test phone numbers need a leading digit and enough length"""
+        assert extract_contact_info(text).phone == expected
+
+    def test_no_contacts(self):
+        """Test text without contact details"""
+        assert extract_contact_info('Python developer wanted') == ContactInfo()
+
+    def test_contact_info_is_frozen(self):
+        """Test ContactInfo can't be modified"""
+        contact = ContactInfo(email='jobs@example.com')
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            contact.email = 'other@example.com'
@@ -0,0 +1,220 @@
+import pytest
+import csv
+import io
+import sqlite3
+
+from flask import g
+from src.output import DatabaseManager
+from web import app as web_app
+
+from .test_output import JOB_COUNT, insert_jobs
+
+@pytest.fixture
+def db_manager(tmp_path, monkeypatch):
+    """Point the web app at a fresh database holding JOB_COUNT jobs"""
+    db_path = str(tmp_path / 'jobs.db')
+    manager = DatabaseManager(db_path)
+    insert_jobs(db_path, JOB_COUNT)
+
+    monkeypatch.setattr(web_app, 'db_manager', manager)
+    web_app.invalidate_cache()
+    return manager
+
+@pytest.fixture
+def client(db_manager):
+    """Flask test client for the web app"""
+    return web_app.app.test_client()
+
+class TestConditionalRequests:
+    """Test cases for ETag handling on the jobs endpoints"""
+
+    @pytest.mark.parametrize('url', ['/api/jobs', '/api/stats', '/export'])
+    def test_not_modified(self, client, url):
+        """Test a matching If-None-Match is answered with an empty 304"""
+        response = client.get(url)
+        etag = response.headers['ETag']
+        response.close()
+
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.headers['ETag'] == etag
+        assert response.data == b''
+
+    @pytest.mark.parametrize('url', ['/api/jobs', '/config'])
+    def test_not_modified_with_coding_suffix(self, client, url):
+        """Test the tag Flask-Compress rewrites to "<tag>:gzip" still revalidates"""
+        etag = client.get(url).headers['ETag']
+
+        response = client.get(url, headers={'If-None-Match': etag[:-1] + ':gzip"'})
+        assert response.status_code == 304
+
+    def test_not_modified_when_compressed(self, client):
+        """Test a compressed response revalidates with the ETag it was sent with"""
+        pytest.importorskip('flask_compress')
+        headers = {'Accept-Encoding': 'gzip'}
+        response = client.get('/api/jobs', headers=headers)
+        assert response.headers['Content-Encoding'] == 'gzip'
+
+        headers['If-None-Match'] = response.headers['ETag']
+        assert client.get('/api/jobs', headers=headers).status_code == 304
+
+    def test_content_etag(self, client):
+        """Test /config revalidates on its content hash, while /health isn't hashed at all"""
+        etag = client.get('/config').headers['ETag']
+        assert client.get('/config', headers={'If-None-Match': etag}).status_code == 304
+
+        assert 'ETag' not in client.get('/health').headers
+
+    def test_etag_changes_when_favorite_moves(self, client, db_manager):
+        """Test moving a favorite to another job changes the ETag"""
+        first, second = db_manager.get_jobs(limit=2)
+        if first['favorite']:
+            client.post(f"/api/jobs/{first['id']}/toggle_favorite")
+        if not second['favorite']:
+            client.post(f"/api/jobs/{second['id']}/toggle_favorite")
+        etag = client.get('/api/jobs?favorite_only=true').headers['ETag']
+
+        client.post(f"/api/jobs/{first['id']}/toggle_favorite")
+        client.post(f"/api/jobs/{second['id']}/toggle_favorite")
+
+        response = client.get('/api/jobs?favorite_only=true', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert first['id'] in [job['id'] for job in response.get_json()['jobs']]
+        assert second['id'] not in [job['id'] for job in response.get_json()['jobs']]
+
+    def test_etag_changes_on_new_jobs(self, client, db_manager):
+        """Test jobs inserted by another connection invalidate the ETag and cached pages"""
+        response = client.get('/api/jobs')
+        etag = response.headers['ETag']
+        assert response.get_json()['total'] == JOB_COUNT
+
+        insert_jobs(db_manager.db_path, 2, first_telegram_id=JOB_COUNT)
+
+        response = client.get('/api/jobs', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.get_json()['total'] == JOB_COUNT + 2
+
+    def test_slow_read_not_served_after_write(self):
+        """Test a value read before a write, but stored after it, isn't served at the new version"""
+        def slow_read():
+            # A request that sees the write fills the cache meanwhile
+            with web_app.app.app_context():
+                g.jobs_version = 2
+                assert web_app.cached(('key',), lambda: 'new') == 'new'
+            return 'old'
+
+        web_app.invalidate_cache()
+        with web_app.app.app_context():
+            g.jobs_version = 1
+            assert web_app.cached(('key',), slow_read) == 'old'
+        with web_app.app.app_context():
+            g.jobs_version = 2
+            assert web_app.cached(('key',), lambda: 'stale') == 'new'
+
+    @pytest.mark.parametrize('url', ['/api/jobs', '/api/stats', '/export'])
+    def test_database_unavailable(self, client, monkeypatch, url):
+        """Test API clients still get a JSON error when there's no database"""
+        monkeypatch.setattr(web_app, 'db_manager', None)
+
+        response = client.get(url)
+        assert response.status_code == 500
+        assert 'error' in response.get_json()
+
+class TestJobsApi:
+    """Test cases for /api/jobs paging"""
+
+    @pytest.mark.parametrize('favorite_only', ['false', 'true'])
+    def test_cursor_walk(self, client, db_manager, favorite_only):
+        """Test following next_cursor returns every job once, in listing order"""
+        expected = [job['id'] for job in db_manager.get_jobs(limit=100, favorite_only=favorite_only == 'true')]
+
+        seen = []
+        data = client.get(f'/api/jobs?per_page=5&favorite_only={favorite_only}').get_json()
+        seen.extend(job['id'] for job in data['jobs'])
+        while data['next_cursor'] is not None:
+            data = client.get(f"/api/jobs?per_page=5&favorite_only={favorite_only}"
+                              f"&cursor={data['next_cursor']}").get_json()
+            seen.extend(job['id'] for job in data['jobs'])
+
+        assert seen == expected
+        assert data['total'] == len(expected)
+
+    def test_unknown_cursor(self, client, db_manager):
+        """Test a cursor naming no job, e.g. a deleted one, is rejected rather than read as the end"""
+        newest = db_manager.get_jobs(limit=1)[0]['id']
+        conn = sqlite3.connect(db_manager.db_path)
+        conn.execute('DELETE FROM jobs WHERE id = ?', (newest,))
+        conn.commit()
+        conn.close()
+
+        for cursor in (newest, 10 ** 6):
+            response = client.get(f'/api/jobs?cursor={cursor}')
+            assert response.status_code == 400
+            assert 'error' in response.get_json()
+
+    def test_page_numbers(self, client):
+        """Test the deprecated page API still reports totals and clamps per_page"""
+        data = client.get('/api/jobs?page=2&per_page=1000').get_json()
+
+        assert data['per_page'] == web_app.MAX_PER_PAGE
+        assert data['total'] == JOB_COUNT
+        assert data['total_pages'] == 1
+        assert data['jobs'] == []
+        assert data['next_cursor'] is None
+
+    @pytest.mark.parametrize('query', ['page=abc', 'per_page=x', 'cursor=abc'])
+    def test_malformed_query(self, client, query):
+        """Test malformed numbers are rejected with a JSON 400"""
+        response = client.get(f'/api/jobs?{query}')
+
+        assert response.status_code == 400
+        assert 'error' in response.get_json()
+
+class TestExport:
+    """Test cases for /export"""
+
+    def test_json_export(self, client):
+        """Test the streamed JSON array holds every job"""
+        response = client.get('/export')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert len(response.get_json()) == JOB_COUNT
+
+    def test_csv_export(self, client):
+        """Test the CSV holds a header and one row per job"""
+        response = client.get('/export?format=csv')
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/csv'
+        assert response.headers['Content-Disposition'] == 'attachment; filename=jobs.csv'
+        assert len(rows) == JOB_COUNT
+        assert tuple(rows[0]) == web_app.EXPORT_COLUMNS
+
+    def test_csv_keywords(self, client, db_manager):
+        """Test matched keywords are written comma separated"""
+        conn = sqlite3.connect(db_manager.db_path)
+        conn.execute('''UPDATE jobs SET matched_keywords = '["python", "remote"]' ''')
+        conn.commit()
+        conn.close()
+
+        rows = list(csv.DictReader(io.StringIO(client.get('/export?format=csv').get_data(as_text=True))))
+        assert {row['matched_keywords'] for row in rows} == {'python, remote'}
+
+    @pytest.mark.parametrize('format_type,expected', [
+        ('json', b'[]'),
+        ('csv', ','.join(web_app.EXPORT_COLUMNS).encode() + b'\r\n'),
+    ])
+    def test_empty_export(self, tmp_path, monkeypatch, format_type, expected):
+        """Test an empty table still exports a valid document"""
+        monkeypatch.setattr(web_app, 'db_manager', DatabaseManager(str(tmp_path / 'empty.db')))
+        web_app.invalidate_cache()
+
+        response = web_app.app.test_client().get(f'/export?format={format_type}')
+        assert response.data == expected
+
+    def test_unsupported_format(self, client):
+        """Test unknown formats are rejected"""
+        assert client.get('/export?format=xml').status_code == 400
@@ -8,10 +8,33 @@ and configure settings.
 
 import sys
 import os
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import Flask, Response, g, render_template, request, jsonify, redirect, url_for, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from werkzeug.http import parse_etags
+import csv
+import functools
+import hashlib
+import io
 import json
 import logging
+import re
+import threading
+import time
+
+# Use orjson for JSON responses when available; it serializes several times
+# faster than the stdlib json module and produces bytes directly
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compress responses when Flask-Compress is available; job listings and
+# exports repeat the same keys on every row and shrink several times over
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -35,8 +58,44 @@ except ImportError as e:
     config = MinimalConfig()
     DatabaseManager = None
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson, falling back to Flask's defaults for other types"""
+    
+    def _orjson_dumps(self, obj) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return self._orjson_dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs) -> Response:
+        # Hand orjson's bytes straight to the response, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._orjson_dumps(obj), mimetype=self.mimetype)
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app)
+app.config.update(
+    COMPRESS_MIMETYPES=['application/json', 'text/csv', 'text/html'],
+    COMPRESS_LEVEL=5,
+    COMPRESS_MIN_SIZE=500,
+)
+if Compress is not None:
+    # Its after_request hook runs once the views have set their ETags, so
+    # it compresses the already tagged body and appends the coding to the
+    # tag; if_none_match_header strips it again on revalidation
+    Compress(app)
+
+def dumps_json(obj) -> str:
+    """Serialize obj with the app's JSON provider"""
+    return app.json.dumps(obj)
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -45,20 +104,173 @@ logger = logging.getLogger(__name__)
 # Initialize database manager if available
 db_manager = DatabaseManager() if DatabaseManager else None
 
+# Short-lived cache for database reads. New jobs arrive on the scraper's
+# schedule (minutes apart), so pages and stats polled by the dashboard can
+# be shared between requests for a few seconds.
+CACHE_TTL_SECONDS = 30
+CACHE_MAX_ENTRIES = 32
+_cache = {}
+_cache_lock = threading.Lock()
+
+def cached(key, compute):
+    """Return the cached value for key at this request's jobs version, computing it if missing or expired"""
+    version = g.get('jobs_version')
+    if version is None:
+        # Without a version a stored value couldn't be told from a stale one
+        return compute()
+    # Values are stored under the version they were read at, so a slow read
+    # that finishes after a write can't be served to requests that see it
+    key = (version, *key)
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+    
+    value = compute()
+    
+    with _cache_lock:
+        if len(_cache) >= CACHE_MAX_ENTRIES:
+            # Drop the oldest entry; dicts keep insertion order
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = (value, now + CACHE_TTL_SECONDS)
+    return value
+
+# Upper bound on page size for the job listings
+MAX_PER_PAGE = 100
+
+# Columns of the jobs table, in the order the CSV export writes them
+EXPORT_COLUMNS = ('id', 'telegram_id', 'message', 'date', 'sender_id', 'chat_id',
+                  'chat_title', 'matched_keywords', 'favorite', 'created_at')
+
+def parse_jobs_args(args):
+    """Parse and clamp the job listing query parameters, raising ValueError on malformed numbers"""
+    page = max(1, int(args.get('page', 1)))
+    per_page = min(MAX_PER_PAGE, max(1, int(args.get('per_page', 20))))
+    favorite_only = args.get('favorite_only', 'false').lower() == 'true'
+    cursor = args.get('cursor')
+    return page, per_page, favorite_only, None if cursor is None else int(cursor)
+
+def next_cursor(jobs_page, per_page):
+    """Cursor for the page after jobs_page, or None if it was the last one"""
+    return jobs_page[-1]['id'] if len(jobs_page) == per_page else None
+
+def count_jobs(favorite_only):
+    """Cached total of the jobs a listing pages through"""
+    return cached(('count_jobs', favorite_only), lambda: db_manager.count_jobs(favorite_only=favorite_only))
+
+def invalidate_cache():
+    """Forget all cached database reads, e.g. when switching databases"""
+    with _cache_lock:
+        _cache.clear()
+
+def jobs_etag():
+    """Weak ETag for the current jobs table as seen by this request's URL, or None if unknown"""
+    version = db_manager.get_jobs_version()
+    if version is None:
+        return None
+    # The scraper inserting or someone favoriting jobs moves the version,
+    # which moves this request's cache reads onto fresh entries
+    g.jobs_version = version
+    
+    # The date is part of the tag because the stats count today's jobs
+    key = f'{version}:{time.strftime("%Y-%m-%d", time.gmtime())}:{request.full_path}'
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+# Flask-Compress appends the coding to the ETag of each body it compresses
+# (W/"<tag>:gzip"), and clients revalidate with that tag; the suffix is
+# stripped so it compares equal to the tag the view computed
+_COMPRESSED_ETAG_SUFFIX_RE = re.compile(r':(?:gzip|deflate|br|zstd)"')
+
+def if_none_match_header():
+    """The request's If-None-Match header without Flask-Compress's coding suffixes"""
+    return _COMPRESSED_ETAG_SUFFIX_RE.sub('"', request.headers.get('If-None-Match', ''))
+
+def conditional_on_jobs(view):
+    """Answer with 304 Not Modified, before querying or serializing, if the jobs haven't changed"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        try:
+            etag = jobs_etag()
+        except Exception as e:
+            logger.error(f'Error checking jobs version: {e}')
+            etag = None
+        if etag is None:
+            # Let the view answer, with its own JSON error if the database is down
+            return view(*args, **kwargs)
+        
+        if parse_etags(if_none_match_header()).contains_weak(etag):
+            response = app.response_class(status=304)
+        else:
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+        response.set_etag(etag, weak=True)
+        return response
+    return wrapper
+
+# The config summary only changes through /api/settings, so the JSON bodies
+# built from it are serialized once and reused until then
+_config_bodies = {}
+
+def config_body(key, build):
+    """Return the serialized JSON body for key, building it on first use"""
+    body = _config_bodies.get(key)
+    if body is None:
+        body = _config_bodies[key] = dumps_json(build())
+    return body
+
+def json_body_response(body, status=200):
+    """Wrap an already serialized JSON body in a response"""
+    return app.response_class(body, status=status, mimetype=app.json.mimetype)
+
+# Health checks poll this many times a minute; it never changes
+HEALTH_BODY = dumps_json({
+    'status': 'healthy',
+    'service': 'Telegram Job Scraper',
+    'timestamp': '2024-01-01T00:00:00Z',
+    'message': 'Web server is running and responding to requests'
+})
+
+# Error pages are fixed HTML: nothing to render per request, and exception
+# text stays in the log instead of the page
+NOT_FOUND_HTML = ('<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+                  '<title>Not found - Telegram Job Scraper</title></head>'
+                  '<body><h1>Page not found</h1><p><a href="/jobs">Back to jobs</a></p></body></html>')
+ERROR_HTML = ('<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+              '<title>Error - Telegram Job Scraper</title></head>'
+              '<body><h1>Something went wrong</h1><p>The error has been logged.</p></body></html>')
+
+def conditional_on_body(view):
+    """Tag the view's 200 responses with a content hash and answer matching If-None-Match with 304"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        response = app.make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            response.add_etag()
+            response = response.make_conditional({**request.environ,
+                                                  'HTTP_IF_NONE_MATCH': if_none_match_header()})
+        return response
+    return wrapper
+
 @app.route('/')
+@conditional_on_body
 def index():
     """Main page showing scraper status and configuration"""
     try:
-        if hasattr(config, 'get_config_summary'):
-            config_summary = config.get_config_summary()
-        else:
-            config_summary = {'status': 'running', 'service': 'Telegram Job Scraper'}
+        def build():
+            if hasattr(config, 'get_config_summary'):
+                config_summary = config.get_config_summary()
+            else:
+                config_summary = {'status': 'running', 'service': 'Telegram Job Scraper'}
+            
+            return {
+                'status': 'running',
+                'service': 'Telegram Job Scraper',
+                'config': config_summary
+            }
         
-        return jsonify({
-            'status': 'running',
-            'service': 'Telegram Job Scraper',
-            'config': config_summary
-        })
+        return json_body_response(config_body('index', build))
     except Exception as e:
         return jsonify({
             'status': 'error',
@@ -69,27 +281,15 @@ def index():
 @app.route('/health')
 def health():
     """Health check endpoint for DigitalOcean App Platform"""
-    try:
-        # Basic health check - just verify the app is running
-        return jsonify({
-            'status': 'healthy',
-            'service': 'Telegram Job Scraper',
-            'timestamp': '2024-01-01T00:00:00Z',
-            'message': 'Web server is running and responding to requests'
-        }), 200
-    except Exception as e:
-        return jsonify({
-            'status': 'unhealthy',
-            'service': 'Telegram Job Scraper',
-            'error': str(e)
-        }), 500
+    # Basic health check - just verify the app is running
+    return json_body_response(HEALTH_BODY)
 
 @app.route('/config')
+@conditional_on_body
 def get_config():
     """Get current configuration (without sensitive data)"""
     try:
-        config_summary = config.get_config_summary()
-        return jsonify(config_summary)
+        return json_body_response(config_body('config', config.get_config_summary))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -97,57 +297,73 @@ def get_config():
 def jobs():
     """Jobs listing page"""
     try:
-        page = request.args.get('page', 1, type=int)
-        per_page = 20
-        offset = (page - 1) * per_page
-        
-        # Get jobs with pagination
-        all_jobs = db_manager.get_jobs(limit=1000)  # Get all for pagination
-        total_jobs = len(all_jobs)
-        jobs_page = all_jobs[offset:offset + per_page]
-        
-        total_pages = (total_jobs + per_page - 1) // per_page
-        
-        return render_template('jobs.html', 
-                             jobs=jobs_page, 
-                             page=page, 
-                             total_pages=total_pages,
-                             total_jobs=total_jobs)
+        # Static shell that renders rows from /api/jobs in the browser, so
+        # paging costs one JSON request rather than a template render
+        response = send_from_directory(app.static_folder, 'jobs.html', max_age=300)
+        response.cache_control.public = True
+        return response
     except Exception as e:
         logger.error(f'Error loading jobs: {e}')
-        return render_template('error.html', error=str(e))
+        return ERROR_HTML, 500
 
 @app.route('/favorites')
 def favorites():
     """Favorites page"""
     try:
-        favorite_jobs = db_manager.get_jobs(limit=100, favorite_only=True)
-        return render_template('favorites.html', jobs=favorite_jobs)
+        # Same static shell as /jobs; it asks /api/jobs for favorites only
+        response = send_from_directory(app.static_folder, 'jobs.html', max_age=300)
+        response.cache_control.public = True
+        return response
     except Exception as e:
         logger.error(f'Error loading favorites: {e}')
-        return render_template('error.html', error=str(e))
+        return ERROR_HTML, 500
 
 @app.route('/api/jobs')
+@conditional_on_jobs
 def api_jobs():
     """API endpoint for jobs"""
     try:
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 20, type=int)
-        favorite_only = request.args.get('favorite_only', 'false').lower() == 'true'
+        page, per_page, favorite_only, cursor = parse_jobs_args(request.args)
+    except ValueError as e:
+        return jsonify({'error': f'Invalid query parameter: {e}'}), 400
+    
+    try:
+        if cursor is not None:
+            # Keyset pagination: continue after the last job the client saw,
+            # which costs the same however deep the client has paged
+            jobs_page = cached(('jobs_after', favorite_only, per_page, cursor),
+                               lambda: db_manager.get_jobs_after(cursor, limit=per_page,
+                                                                 favorite_only=favorite_only))
+            if jobs_page is None:
+                # A made-up cursor, or the job it named was deleted
+                return jsonify({'error': f'Unknown cursor: {cursor}'}), 400
+            return jsonify({
+                'jobs': jobs_page,
+                'total': count_jobs(favorite_only),
+                'per_page': per_page,
+                'next_cursor': next_cursor(jobs_page, per_page)
+            })
         
+        # Deprecated: page numbers make SQLite skip OFFSET rows on every
+        # request; kept for existing clients, new ones should follow next_cursor
         offset = (page - 1) * per_page
         
-        # Get jobs
-        all_jobs = db_manager.get_jobs(limit=1000, favorite_only=favorite_only)
-        total_jobs = len(all_jobs)
-        jobs_page = all_jobs[offset:offset + per_page]
+        # Get the total first; pages past the end skip the jobs query
+        total_jobs = count_jobs(favorite_only)
+        if offset < total_jobs:
+            jobs_page = cached(('jobs', favorite_only, per_page, offset),
+                               lambda: db_manager.get_jobs(limit=per_page, offset=offset,
+                                                           favorite_only=favorite_only))
+        else:
+            jobs_page = []
         
         return jsonify({
             'jobs': jobs_page,
             'total': total_jobs,
             'page': page,
             'per_page': per_page,
-            'total_pages': (total_jobs + per_page - 1) // per_page
+            'total_pages': (total_jobs + per_page - 1) // per_page,
+            'next_cursor': next_cursor(jobs_page, per_page)
         })
     except Exception as e:
         logger.error(f'API error: {e}')
@@ -167,16 +383,18 @@ def api_toggle_favorite(job_id):
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/stats')
+@conditional_on_jobs
 def api_stats():
     """API endpoint for statistics"""
     try:
-        stats = db_manager.get_statistics()
+        stats = cached(('stats',), db_manager.get_statistics)
         return jsonify(stats)
     except Exception as e:
         logger.error(f'Error getting stats: {e}')
         return jsonify({'error': str(e)}), 500
 
 @app.route('/settings')
+@conditional_on_body
 def settings():
     """Settings page"""
     try:
@@ -191,7 +409,7 @@ def settings():
         return render_template('settings.html', config=current_config)
     except Exception as e:
         logger.error(f'Error loading settings: {e}')
-        return render_template('error.html', error=str(e))
+        return ERROR_HTML, 500
 
 @app.route('/api/settings', methods=['POST'])
 def api_update_settings():
@@ -202,6 +420,7 @@ def api_update_settings():
         # Update configuration (this would need to be implemented)
         # For now, just return success
         logger.info(f'Settings update requested: {data}')
+        _config_bodies.clear()
         
         return jsonify({'success': True, 'message': 'Settings updated'})
     except Exception as e:
@@ -209,17 +428,52 @@ def api_update_settings():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/export')
+@conditional_on_jobs
 def export():
     """Export jobs page"""
     try:
         format_type = request.args.get('format', 'json')
         
+        if format_type in ('json', 'csv'):
+            # Set up the walk here rather than inside the generators, so a
+            # missing database fails with a JSON error before streaming starts
+            chunks = db_manager.iter_jobs()
+        
         if format_type == 'json':
-            jobs = db_manager.get_jobs(limit=1000)
-            return jsonify(jobs), 200, {'Content-Type': 'application/json'}
+            # Stream the array a chunk of rows at a time instead of building
+            # the whole document in memory first
+            def generate():
+                yield '['
+                first = True
+                for chunk in chunks:
+                    for job in chunk:
+                        yield ('' if first else ',') + dumps_json(job)
+                        first = False
+                yield ']'
+            
+            return Response(generate(), mimetype='application/json')
         elif format_type == 'csv':
-            # CSV export would need to be implemented
-            return jsonify({'error': 'CSV export not implemented yet'}), 501
+            # Same chunked walk, each chunk written by the csv module into a
+            # reused buffer and sent as one piece
+            def generate():
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, extrasaction='ignore')
+                writer.writeheader()
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                
+                for chunk in chunks:
+                    for job in chunk:
+                        if job['matched_keywords']:
+                            job['matched_keywords'] = ', '.join(job['matched_keywords'])
+                    writer.writerows(chunk)
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+            
+            return Response(generate(), mimetype='text/csv',
+                            headers={'Content-Disposition': 'attachment; filename=jobs.csv'})
         else:
             return jsonify({'error': 'Unsupported format'}), 400
             
@@ -229,11 +483,11 @@ def export():
 
 @app.errorhandler(404)
 def not_found(error):
-    return render_template('404.html'), 404
+    return NOT_FOUND_HTML, 404
 
 @app.errorhandler(500)
 def internal_error(error):
-    return render_template('error.html', error='Internal server error'), 500
+    return ERROR_HTML, 500
 
 if __name__ == '__main__':
     # Get port from environment or use default